@@ -2,62 +2,261 @@
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
-from gi.repository import Gtk, Adw, GLib, Gio
+# Loading Adw loads Gtk too, and CanvasNoteApp subclasses Adw.Application,
+# so these bindings are always loaded at import time. The UI (and with it
+# Gdk, Pango and cairo) is imported on first activation instead.
+from gi.repository import Adw, Gio, GLib
+import importlib
+import importlib.util
 import logging
+import logging.handlers
+import os
 import sys
-from pathlib import Path
+import threading
+import time
 
-from .ui.main_window import MainWindow
+LOG_FORMAT = '%(asctime)s [%(levelname)s] %(name)s: %(message)s'
+LOG_DATEFMT = '%Y-%m-%d %H:%M:%S'
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
+# Records buffered per handler before they are written out
+LOG_BUFFER_CAPACITY = 256
 
 logger = logging.getLogger(__name__)
 
+# Base-class vfunc resolved once instead of on every chained call
+_ADW_APP_SHUTDOWN = Adw.Application.do_shutdown
+
+# Monotonic time main() was entered, for the startup-time log record
+_start_time = None
+
+# Startup timeline written on shutdown with --trace-startup or CANVASNOTE_TRACE=1
+TRACE_FILE = 'canvasnote-startup.json'
+_trace = None
+
+
+# Pure-Python modules the UI only imports on first use (PDF export, note
+# duplication). They are imported on a background thread once the window is
+# up so that first use doesn't stall the UI. Only list modules that are safe
+# to import off the main thread - never gi.repository modules or anything
+# that touches GTK at import time.
+WARMUP_MODULES = (
+    'reportlab.pdfgen.canvas',
+    'reportlab.lib.pagesizes',
+    'tempfile',
+    'shutil',
+)
+
+
+def _warm_up_imports():
+    """Import WARMUP_MODULES so their first real use is cheap."""
+    for name in WARMUP_MODULES:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            logger.debug("Skipping warm-up of unavailable module %s", name)
+
+
+def _trace_mark(name):
+    """Record a startup milestone if tracing is enabled."""
+    if _trace is not None:
+        _trace.mark(name)
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that reuses the formatted timestamp within the same second.
+    
+    Only valid for date formats with one-second resolution, such as LOG_DATEFMT.
+    """
+    
+    def __init__(self, fmt=None, datefmt=None):
+        super().__init__(fmt, datefmt)
+        self._cached_time = (None, '')  # (epoch second, formatted time)
+    
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        cached_second, formatted = self._cached_time
+        if second != cached_second:
+            formatted = super().formatTime(record, datefmt)
+            self._cached_time = (second, formatted)
+        return formatted
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as one JSON object per line.
+    
+    Uses orjson when it is installed and falls back to the stdlib encoder.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        try:
+            import orjson
+            self._dumps = lambda data: orjson.dumps(data).decode()
+        except ImportError:
+            import json
+            self._dumps = json.dumps
+    
+    def format(self, record):
+        data = {
+            'ts': record.created,
+            'level': record.levelname,
+            'name': record.name,
+            'msg': record.getMessage()
+        }
+        if record.exc_info:
+            data['exc'] = self.formatException(record.exc_info)
+        return self._dumps(data)
+
+
+def setup_logging(handlers=None, level=logging.WARNING):
+    """Configure root logging with buffered output.
+    
+    Each handler is wrapped in a MemoryHandler so records are written in
+    batches instead of one write per record. WARNING and above are flushed
+    immediately; everything else is flushed by flush_logging().
+    Does nothing if the root logger is already configured.
+    
+    Args:
+        handlers: Handlers to write to. Defaults to a single stderr stream handler.
+        level: Root logger level, overridden by the CANVASNOTE_LOG environment
+            variable (e.g. CANVASNOTE_LOG=debug).
+    
+    Set CANVASNOTE_LOG_JSON=1 to write JSON lines instead of plain text.
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return
+    
+    level = os.environ.get('CANVASNOTE_LOG', level)
+    if isinstance(level, str):
+        level = level.upper()
+    
+    # LOG_FORMAT doesn't use caller, thread or process fields, so skip
+    # collecting them (the caller lookup walks the stack on every record)
+    logging._srcfile = None
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    
+    if handlers is None:
+        handlers = [logging.StreamHandler()]
+    
+    if os.environ.get('CANVASNOTE_LOG_JSON'):
+        formatter = JsonFormatter()
+    else:
+        formatter = CachedTimeFormatter(LOG_FORMAT, LOG_DATEFMT)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+        root.addHandler(logging.handlers.MemoryHandler(
+            LOG_BUFFER_CAPACITY,
+            flushLevel=logging.WARNING,
+            target=handler
+        ))
+    try:
+        root.setLevel(level)
+    except ValueError:
+        root.setLevel(logging.WARNING)
+        logger.warning("Invalid CANVASNOTE_LOG level: %s", level)
+
+
+def flush_logging():
+    """Flush buffered log records (also used as a GLib timeout callback)."""
+    for handler in logging.getLogger().handlers:
+        handler.flush()
+    return True  # Keep the timeout running
+
 
 class CanvasNoteApp(Adw.Application):
     """Main application class."""
     
-    def __init__(self):
+    def __init__(self, new_instance=False):
+        # Single instance by default: launching again hands the command line
+        # to the running process over D-Bus instead of starting a new one
+        flags = Gio.ApplicationFlags.HANDLES_COMMAND_LINE
+        # The strictly confined snap declares no D-Bus slot, so it may not
+        # own the application id on the session bus; run non-unique there
+        if new_instance or 'SNAP' in os.environ:
+            flags |= Gio.ApplicationFlags.NON_UNIQUE
+        
         super().__init__(
             application_id='com.canvasnote.app',
-            flags=Gio.ApplicationFlags.NON_UNIQUE
+            flags=flags
         )
         self.window = None
-        logger.info("CanvasNote application initialized")
+        logger.debug("CanvasNote application initialized")
+    
+    def do_command_line(self, command_line):
+        """Handle a launch, including ones forwarded from another instance."""
+        self.activate()
+        return 0
     
     def do_activate(self):
         """Activate the application."""
-        if not self.window:
+        if self.window is None:
+            _trace_mark("activate")
+            # Imported here so loading this module doesn't pull in the whole UI stack
+            from .ui.main_window import MainWindow
+            _trace_mark("main window imported")
             self.window = MainWindow(self)
+            _trace_mark("main window built")
+            self.window.present()
+            _trace_mark("main window presented")
+            if _trace is not None:
+                _trace.stop_import_tracing()
+            threading.Thread(target=_warm_up_imports, daemon=True).start()
+            if _start_time is not None:
+                logger.info("CanvasNote ready in %.1f ms", (time.monotonic() - _start_time) * 1000)
+            return
         
         self.window.present()
-        logger.info("Application window presented")
+        logger.debug("Application window presented")
     
     def do_shutdown(self):
         """Shutdown the application."""
-        logger.info("Application shutting down")
-        Adw.Application.do_shutdown(self)
+        logger.debug("Application shutting down")
+        if self.window is not None:
+            self.window.notes_library.flush()
+        if _trace is not None:
+            _trace.save(TRACE_FILE)
+        flush_logging()
+        # Always chain up, even if no window was created: GApplication treats
+        # a ::shutdown override that doesn't chain up as a critical error
+        _ADW_APP_SHUTDOWN(self)
 
 
 def main():
     """Main entry point."""
-    logger.info("Starting CanvasNote application")
+    global _start_time, _trace
+    _start_time = time.monotonic()
     
-    # Check for required dependencies
-    try:
-        import cairo
-        import evdev
+    if os.environ.get('CANVASNOTE_TRACE') or '--trace-startup' in sys.argv[1:]:
+        from .startup_trace import StartupTrace
+        _trace = StartupTrace()
+        _trace.start_import_tracing()
+        _trace_mark("main")
+    
+    setup_logging()
+    logger.debug("Starting CanvasNote application")
+    
+    # Check for required dependencies without importing (and initializing) them
+    missing = [name for name in ('cairo', 'evdev') if importlib.util.find_spec(name) is None]
+    if missing:
+        logger.warning("Missing dependency: %s", ", ".join(missing))
+    else:
         logger.info("All dependencies available")
-    except ImportError as e:
-        logger.warning(f"Missing dependency: {e}")
     
-    app = CanvasNoteApp()
-    return app.run(sys.argv)
+    # --new-instance opts out of handing off to an already running CanvasNote
+    new_instance = '--new-instance' in sys.argv[1:]
+    
+    app = CanvasNoteApp(new_instance=new_instance)
+    _trace_mark("application created")
+    
+    # Write out buffered log records at least once a second
+    GLib.timeout_add_seconds(1, flush_logging)
+    
+    # Arguments are handled here, so GApplication (and the D-Bus handoff to a
+    # running instance) only needs the program name
+    return app.run(sys.argv[:1])
 
 
 if __name__ == '__main__':
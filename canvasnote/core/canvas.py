@@ -3,15 +3,225 @@ import gi
 gi.require_version('Gtk', '4.0')
 from gi.repository import Gtk, Gdk, GLib, Gio, GdkPixbuf
 import cairo
-from typing import Optional
+from collections import deque
+from typing import List, Optional, Tuple
 import logging
+import math
 from pathlib import Path
 
-from .stroke import DrawingDocument, Stroke, Point, PenType, Shape, ShapeType, Selection, SelectionMode, TextBox
-import copy
+from .stroke import (DrawingDocument, Stroke, Point, PenType, Shape, ShapeType, Selection, SelectionMode,
+                     TextBox, NoteType, PageTemplate)
 
 logger = logging.getLogger(__name__)
 
+# Number of undo (and redo) steps kept; older ones are dropped. A step is
+# one user operation: a drawn item, or a whole paste or deletion
+UNDO_LIMIT = 200
+
+# Device pixels of rendered A4 pages kept around for redraws (4 bytes each),
+# and the largest page image worth caching; bigger pages are drawn directly
+PAGE_CACHE_BUDGET_PIXELS = 2 * 4096 * 4096
+PAGE_CACHE_MAX_PIXELS = 4096 * 4096
+
+# Stroke layers with at least this many strokes get a grid of cells (in
+# document units) for finding the strokes inside the redraw area; strokes
+# covering more than STROKE_GRID_MAX_CELLS cells are always tested instead
+STROKE_GRID_MIN_STROKES = 64
+STROKE_GRID_CELL = 256
+STROKE_GRID_MAX_CELLS = 64
+
+# Unit-circle vertices of a regular pentagon, starting from the top
+_PENTAGON_UNIT = tuple(
+    (math.cos(angle), math.sin(angle))
+    for angle in (i * math.tau / 5 - math.pi / 2 for i in range(5))
+)
+
+# Control point distance for approximating a quarter circle with a cubic Bézier
+_ELLIPSE_KAPPA = 4 * (math.sqrt(2) - 1) / 3
+
+
+# Readable names of Gdk.InputSource values for logging
+_SOURCE_NAMES = {1: "MOUSE", 2: "PEN", 3: "TOUCHSCREEN", 4: "TOUCHPAD",
+                 5: "TRACKPOINT", 6: "TABLET_PAD"}
+
+
+def _source_name(source_value: int) -> str:
+    """Get a readable name for an input source value."""
+    name = _SOURCE_NAMES.get(source_value)
+    return name if name is not None else f"UNKNOWN({source_value})"
+
+
+def _texture_noise(seed: int) -> float:
+    """Map an integer seed to a repeatable value in [0, 1).
+    
+    Multiplicative hashing stands in for seeding the global random
+    generator, which was slow and clobbered its state for other users.
+    """
+    return ((seed * 2654435761) & 0xFFFFFFFF) / 4294967296
+
+
+def _pencil_segments(stroke: Stroke):
+    """Compute the width and opacity of each segment of a pencil stroke.
+    
+    Each segment takes its values from the point it starts at. Opacity only
+    changes on tilted segments and otherwise carries over from the last one.
+    
+    Returns:
+        Tuple of (widths, opacities), one entry per segment
+    """
+    xs, ys, pressures, tilts_x, tilts_y = stroke.get_columns()
+    base_width = stroke.width * 0.8
+    widths = []
+    opacities = []
+    opacity = 1.0
+    for x, y, pressure, tilt_x, tilt_y in zip(xs[:-1], ys, pressures, tilts_x, tilts_y):
+        # Pencil has more pressure variation and is slightly thinner
+        width = base_width * pressure
+        
+        # Apply tilt-based width variation (simulates pencil angle)
+        # Higher tilt values (pen tilted) = wider stroke (shading)
+        tilt_magnitude = math.hypot(tilt_x, tilt_y)
+        if tilt_magnitude > 0.1:  # If tilt is significant
+            # Increase width up to 1.5x when tilted
+            width *= 1.0 + (tilt_magnitude * 0.5)
+            # Reduce opacity slightly when tilted (lighter shading)
+            opacity = max(0.6, 1.0 - (tilt_magnitude * 0.2))
+        
+        # Add slight variation for texture, hashed from the segment
+        # position so it stays the same on every redraw
+        width *= 0.9 + _texture_noise(int(x * y)) * 0.2
+        
+        widths.append(width)
+        opacities.append(opacity)
+    return widths, opacities
+
+
+def _any_point_within(xs, ys, cx: float, cy: float, radius_sq: float) -> bool:
+    """Return True if any (xs[i], ys[i]) lies within the circle around (cx, cy).
+    
+    Compares squared distances so no square root is taken per point.
+    """
+    for px, py in zip(xs, ys):
+        dx = px - cx
+        dy = py - cy
+        if dx * dx + dy * dy <= radius_sq:
+            return True
+    return False
+
+
+def _erase_runs(xs, ys, centers, radius_sq: float) -> Optional[List[Tuple[int, int]]]:
+    """Find the parts of a stroke left over after erasing around the centers.
+    
+    Tests every point against the eraser circles and collects the runs of
+    points that survive in the same scan.
+    
+    Returns:
+        List of (start, end) index ranges of surviving runs with at least
+        two points, or None if no point was erased
+    """
+    runs = []
+    run_start = 0
+    hit = False
+    for i, (px, py) in enumerate(zip(xs, ys)):
+        for cx, cy in centers:
+            dx = px - cx
+            dy = py - cy
+            if dx * dx + dy * dy <= radius_sq:
+                # Close the run before this point; it needs 2+ points to keep
+                if i - run_start >= 2:
+                    runs.append((run_start, i))
+                run_start = i + 1
+                hit = True
+                break
+    
+    if not hit:
+        return None
+    
+    # Add the final run after the last erased point
+    if len(xs) - run_start >= 2:
+        runs.append((run_start, len(xs)))
+    return runs
+
+
+def _circle_hits_rect(cx: float, cy: float, radius_sq: float,
+                      min_x: float, min_y: float, max_x: float, max_y: float) -> bool:
+    """Return True if the circle around (cx, cy) touches the rectangle.
+    
+    Measures the squared distance from the center to the nearest point of
+    the rectangle, so the rectangle's corners are not hit from the corners
+    of the circle's bounding square.
+    """
+    nearest_x = min_x if cx < min_x else (max_x if cx > max_x else cx)
+    nearest_y = min_y if cy < min_y else (max_y if cy > max_y else cy)
+    dx = cx - nearest_x
+    dy = cy - nearest_y
+    return dx * dx + dy * dy <= radius_sq
+
+
+def _items_overlapping(items, min_x: float, min_y: float, max_x: float, max_y: float) -> list:
+    """Return the items whose get_bounds() overlaps the given rectangle."""
+    overlapping = []
+    for item in items:
+        item_min_x, item_min_y, item_max_x, item_max_y = item.get_bounds()
+        if (item_min_x <= max_x and item_max_x >= min_x and
+                item_min_y <= max_y and item_max_y >= min_y):
+            overlapping.append(item)
+    return overlapping
+
+
+def _build_stroke_grid(strokes):
+    """Index strokes by the grid cells their padded bounds cover.
+    
+    Returns:
+        Tuple of (dict of (cell_x, cell_y) -> stroke indices, indices of
+        strokes too large to index)
+    """
+    cell = STROKE_GRID_CELL
+    grid = {}
+    large = []
+    for index, stroke in enumerate(strokes):
+        min_x, min_y, max_x, max_y = stroke.get_bounds()
+        pad = stroke.width
+        x1 = int((min_x - pad) // cell)
+        y1 = int((min_y - pad) // cell)
+        x2 = int((max_x + pad) // cell)
+        y2 = int((max_y + pad) // cell)
+        if (x2 - x1 + 1) * (y2 - y1 + 1) > STROKE_GRID_MAX_CELLS:
+            large.append(index)
+            continue
+        for cell_x in range(x1, x2 + 1):
+            for cell_y in range(y1, y2 + 1):
+                indices = grid.get((cell_x, cell_y))
+                if indices is None:
+                    grid[(cell_x, cell_y)] = [index]
+                else:
+                    indices.append(index)
+    return grid, large
+
+
+def _drop_items(items: list, to_remove):
+    """Remove objects known to be in a list, in place, matching by identity."""
+    removed_ids = {id(obj) for obj in to_remove}
+    items[:] = [item for item in items if id(item) not in removed_ids]
+
+
+def _remove_items(items: list, to_remove) -> list:
+    """Remove objects from a list in place, matching them by identity.
+    
+    Strokes, shapes and text boxes are dataclasses whose == compares every
+    field (and every point), so list.remove() would both scan slowly and
+    could drop an equal-looking copy instead of the object itself. This
+    rebuilds the list once for the whole batch.
+    
+    Returns:
+        The objects of to_remove that were in the list, in their given order
+    """
+    present = {id(item) for item in items}
+    removed = [obj for obj in to_remove if id(obj) in present]
+    if removed:
+        _drop_items(items, removed)
+    return removed
+
 
 class DrawingCanvas(Gtk.DrawingArea):
     """Custom drawing area with Cairo rendering."""
@@ -21,13 +231,19 @@ class DrawingCanvas(Gtk.DrawingArea):
         
         self.document = DrawingDocument()
         self.current_stroke: Optional[Stroke] = None
-        self.undo_stack = []
-        self.redo_stack = []
+        self.undo_stack = deque(maxlen=UNDO_LIMIT)
+        self.redo_stack = deque(maxlen=UNDO_LIMIT)
         
         # Drawing state
         self.is_drawing = False
         self.last_x = 0
         self.last_y = 0
+        # Page offset (x, y) of the current stroke in A4 mode, set by start_stroke
+        self._stroke_page_origin = (0.0, 0.0)
+        # Eraser samples waiting for the next frame, and the tick callback
+        # that will erase them
+        self._pending_erase = []
+        self._erase_tick_id = 0
         
         # Current tool settings
         self.current_pen_type = PenType.PEN
@@ -44,6 +260,7 @@ class DrawingCanvas(Gtk.DrawingArea):
         self.shape_start_x = 0.0
         self.shape_start_y = 0.0
         self.shape_preview = None
+        self._preview_base = None  # Recorded canvas content under the preview
         self.shape_filled = False
         self.shape_line_style = 'solid'
         
@@ -74,6 +291,16 @@ class DrawingCanvas(Gtk.DrawingArea):
         self.pan_y = 0.0
         self.zoom = 1.0
         
+        # Cached renders of committed page content (see draw_cached_page)
+        self._page_cache = {}
+        self._page_cache_document = None
+        self._dot_pattern = None
+        self._stroke_layers = {}
+        self._stroke_grids = {}
+        self._page_number_font = cairo.ToyFontFace("Sans", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_NORMAL)
+        # Pango font descriptions for text boxes, by (family, size, bold, italic)
+        self._font_descriptions = {}
+        
         # Dark mode
         self.dark_mode = False
         
@@ -86,9 +313,8 @@ class DrawingCanvas(Gtk.DrawingArea):
         # Eraser mode: 'stroke' (entire stroke) or 'pixel' (partial erase)
         self.eraser_mode = 'pixel'  # Default to pixel eraser for more precise control
         
-        # Custom cursors for tools
+        # Custom cursors for tools, loaded on first use (see get_tool_cursor)
         self.cursors = {}
-        self.load_custom_cursors()
         
         # Set up drawing function
         self.set_draw_func(self.on_draw)
@@ -126,8 +352,15 @@ class DrawingCanvas(Gtk.DrawingArea):
         assets_dir = Path(__file__).parent.parent / "assets"
         return str(assets_dir / filename)
     
-    def load_custom_cursors(self):
-        """Load custom cursors for each tool from PNG assets."""
+    def get_tool_cursor(self, pen_type: PenType):
+        """Get the custom cursor for a tool, loading its PNG asset on first use.
+        
+        Returns:
+            The cursor, or None if the tool has none or it failed to load
+        """
+        if pen_type in self.cursors:
+            return self.cursors[pen_type]
+        
         # Define cursor mappings with appropriate hotspot positions
         # Hotspot is where the actual writing/erasing point is located
         cursor_mappings = {
@@ -141,24 +374,27 @@ class DrawingCanvas(Gtk.DrawingArea):
             PenType.ERASER: ("eraser.png", 16, 24)
         }
         
-        try:
-            for pen_type, (icon_file, hotspot_x, hotspot_y) in cursor_mappings.items():
-                icon_path = self.get_asset_path(icon_file)
-                if Path(icon_path).exists():
-                    # Load the PNG as a pixbuf
-                    pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
-                        icon_path, 32, 32, True
-                    )
-                    # Create texture from pixbuf
-                    texture = Gdk.Texture.new_for_pixbuf(pixbuf)
-                    # Create cursor from texture with hotspot at the tool's tip/working point
-                    cursor = Gdk.Cursor.new_from_texture(texture, hotspot_x, hotspot_y, None)
-                    self.cursors[pen_type] = cursor
-                    logger.info(f"Loaded cursor for {pen_type.value} with hotspot at ({hotspot_x}, {hotspot_y})")
-                else:
-                    logger.warning(f"Cursor icon not found: {icon_path}")
-        except Exception as e:
-            logger.error(f"Error loading custom cursors: {e}")
+        cursor = None
+        if pen_type in cursor_mappings:
+            icon_file, hotspot_x, hotspot_y = cursor_mappings[pen_type]
+            icon_path = self.get_asset_path(icon_file)
+            try:
+                # The icons are larger than a cursor, so scale them down to
+                # 32x32 to match the hotspot positions above
+                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
+                    icon_path, 32, 32, True
+                )
+                # Create texture from pixbuf
+                texture = Gdk.Texture.new_for_pixbuf(pixbuf)
+                # Create cursor from texture with hotspot at the tool's tip/working point
+                cursor = Gdk.Cursor.new_from_texture(texture, hotspot_x, hotspot_y, None)
+                logger.debug(f"Loaded cursor for {pen_type.value} with hotspot at ({hotspot_x}, {hotspot_y})")
+            except GLib.Error as e:
+                logger.warning(f"Could not load cursor icon {icon_path}: {e.message}")
+        
+        # Remember failures too, so a missing icon is only tried once
+        self.cursors[pen_type] = cursor
+        return cursor
     
     def update_cursor(self):
         """Update the canvas cursor based on current tool."""
@@ -171,7 +407,7 @@ class DrawingCanvas(Gtk.DrawingArea):
         elif self.shape_mode:
             # Use crosshair for shape drawing
             self.set_cursor(Gdk.Cursor.new_from_name("crosshair", None))
-        elif self.current_pen_type in self.cursors:
+        elif self.get_tool_cursor(self.current_pen_type):
             # Use custom cursor for drawing tools
             self.set_cursor(self.cursors[self.current_pen_type])
         else:
@@ -226,10 +462,14 @@ class DrawingCanvas(Gtk.DrawingArea):
         self.gesture_zoom = Gtk.GestureZoom.new()
         self.gesture_zoom.connect('scale-changed', self.on_zoom_changed)
         self.gesture_zoom.connect('begin', self.on_zoom_begin)
+        self.gesture_zoom.connect('end', self.on_zoom_end)
+        self.gesture_zoom.connect('cancel', self.on_zoom_end)
         self.add_controller(self.gesture_zoom)
         
         # Store initial zoom level for relative scaling
         self.zoom_start = 1.0
+        # True while a pinch is changing the zoom every frame
+        self.zooming = False
         
         # Scroll controller for Ctrl+Wheel zoom
         self.scroll_controller = Gtk.EventControllerScroll.new(
@@ -372,25 +612,21 @@ class DrawingCanvas(Gtk.DrawingArea):
         cr.translate(self.pan_x, self.pan_y)
         cr.scale(self.zoom, self.zoom)
         
-        from .stroke import NoteType
         if self.document.note_type == NoteType.A4_NOTES:
             # Draw all pages vertically with gaps
             self.draw_all_pages(cr, width, height)
         else:
             # Canvas mode - draw with proper layering
-            current_strokes = self.document.get_current_strokes()
-            
-            # Draw strokes with z-order: highlighters first, then others
-            self.draw_strokes_by_layer(cr, current_strokes)
-            
-            current_shapes = self.document.get_current_shapes()
-            for shape in current_shapes:
-                self.draw_shape(cr, shape)
-            
-            # Draw text boxes
-            current_text_boxes = self.document.get_current_text_boxes()
-            for text_box in current_text_boxes:
-                self.draw_text_box(cr, text_box)
+            if self.shape_preview:
+                # Nothing else changes while a shape is dragged out, so record
+                # the committed content once and replay it under the preview
+                if self._preview_base is None:
+                    self._preview_base = cairo.RecordingSurface(cairo.CONTENT_COLOR_ALPHA, None)
+                    self.draw_canvas_content(cairo.Context(self._preview_base))
+                cr.set_source_surface(self._preview_base, 0, 0)
+                cr.paint()
+            else:
+                self.draw_canvas_content(cr)
             
             # Draw current text box being edited
             if self.current_text_box:
@@ -411,6 +647,19 @@ class DrawingCanvas(Gtk.DrawingArea):
                 if not self.selection.is_empty():
                     self.draw_selection_bounds(cr)
     
+    def draw_canvas_content(self, cr):
+        """Draw the committed strokes, shapes and text boxes in canvas mode."""
+        current_strokes, current_shapes, current_text_boxes = self.document.get_current_items()
+        
+        # Draw strokes with z-order: highlighters first, then others
+        self.draw_strokes_by_layer(cr, current_strokes)
+        
+        self.draw_shapes(cr, current_shapes)
+        
+        # Draw text boxes
+        for text_box in current_text_boxes:
+            self.draw_text_box(cr, text_box)
+    
     def get_page_layout(self, canvas_width):
         """Calculate page layout with 10% padding on each side."""
         # Calculate page position (10% padding on each side = 80% width)
@@ -428,98 +677,220 @@ class DrawingCanvas(Gtk.DrawingArea):
         page_height = self.document.height
         page_gap = 20  # Gap between pages for visual separation
         top_padding = 30  # Padding at the top
+        inv_zoom = 1.0 / self.zoom  # Scales screen-pixel sizes to page units
         
         offset_x = self.get_page_layout(canvas_width)
         
         # Update content size for scrolling
-        page_numbers = sorted(self.document.pages.keys())
+        page_numbers = self.document.get_page_numbers()
         total_height = top_padding + len(page_numbers) * (page_height + page_gap) + 100
         total_height_zoomed = int(total_height * self.zoom)
         
         # Force content width to exactly match canvas width (no horizontal scroll)
         # Content height allows vertical scrolling only
+        # Only resize when the size changed: a resize queues another
+        # allocation and draw cycle
         canvas_width_int = int(canvas_width) if canvas_width > 0 else 800
-        self.set_content_width(canvas_width_int)
-        self.set_content_height(max(total_height_zoomed, canvas_height + 100))
+        content_height = max(total_height_zoomed, canvas_height + 100)
+        if self.get_content_width() != canvas_width_int:
+            self.set_content_width(canvas_width_int)
+        if self.get_content_height() != content_height:
+            self.set_content_height(content_height)
         
-        # Get all page numbers
-        page_numbers = sorted(self.document.pages.keys())
+        # Vertical extent of the area being redrawn
+        _, clip_top, _, clip_bottom = cr.clip_extents()
         
+        # Collect the pages in view (and their shadow); the rest are skipped
+        visible_pages = []
         for page_num in page_numbers:
             # Calculate Y position for this page
             page_y = top_padding + (page_num - 1) * (page_height + page_gap)
-            
+            if page_y + page_height + page_gap < clip_top or page_y > clip_bottom:
+                continue
+            visible_pages.append((page_num, page_y))
+        
+        current_page = self.document.current_page
+        
+        # Draw subtle shadows for depth, all in one fill
+        shadow_offset = 4 * inv_zoom
+        cr.set_source_rgba(0, 0, 0, 0.1)
+        for page_num, page_y in visible_pages:
+            cr.rectangle(offset_x + shadow_offset, page_y + shadow_offset, page_width, page_height)
+        cr.fill()
+        
+        # Draw page backgrounds (white), all in one fill
+        cr.set_source_rgb(1.0, 1.0, 1.0)
+        for page_num, page_y in visible_pages:
+            cr.rectangle(offset_x, page_y, page_width, page_height)
+        cr.fill()
+        
+        # Draw page boundaries under the page content: inactive pages get a
+        # gray border in one stroke, the current page a blue highlight
+        cr.set_source_rgba(0.8, 0.8, 0.8, 0.6)
+        cr.set_line_width(inv_zoom)
+        for page_num, page_y in visible_pages:
+            if page_num != current_page:
+                cr.rectangle(offset_x, page_y, page_width, page_height)
+        cr.stroke()
+        
+        current_page_y = None
+        for page_num, page_y in visible_pages:
+            if page_num == current_page:
+                current_page_y = page_y
+                cr.set_source_rgba(0.3, 0.5, 0.9, 0.3)
+                cr.set_line_width(3 * inv_zoom)
+                cr.rectangle(offset_x, page_y, page_width, page_height)
+                cr.stroke()
+        
+        # Draw page template and committed content
+        for page_num, page_y in visible_pages:
             cr.save()
             cr.translate(offset_x, page_y)
-            
-            # Draw subtle shadow for depth
-            shadow_offset = 4 / self.zoom
-            cr.set_source_rgba(0, 0, 0, 0.1)
-            cr.rectangle(shadow_offset, shadow_offset, page_width, page_height)
-            cr.fill()
-            
-            # Draw page background (white)
-            cr.set_source_rgb(1.0, 1.0, 1.0)
-            cr.rectangle(0, 0, page_width, page_height)
-            cr.fill()
-            
-            # Draw page boundary with highlight for current page
-            if self.document.current_page == page_num:
-                # Active page - blue highlight
-                cr.set_source_rgba(0.3, 0.5, 0.9, 0.3)
-                cr.set_line_width(3 / self.zoom)
-            else:
-                # Inactive page - gray border
-                cr.set_source_rgba(0.8, 0.8, 0.8, 0.6)
-                cr.set_line_width(1 / self.zoom)
-            cr.rectangle(0, 0, page_width, page_height)
-            cr.stroke()
-            
-            # Draw template for this page
-            self.draw_page_template_at(cr, 0, 0, page_width, page_height)
-            
-            # Draw strokes for this page with proper layering
-            page_strokes = self.document.pages.get(page_num, [])
-            self.draw_strokes_by_layer(cr, page_strokes)
-            
-            # Draw shapes for this page
-            page_shapes = self.document.page_shapes.get(page_num, [])
-            for shape in page_shapes:
-                self.draw_shape(cr, shape)
-            
-            # Draw text boxes for this page
-            page_text_boxes = self.document.page_text_boxes.get(page_num, [])
-            for text_box in page_text_boxes:
-                self.draw_text_box(cr, text_box)
-            
-            # Draw current stroke if on this page
-            if self.document.current_page == page_num:
-                if self.current_stroke and len(self.current_stroke.points) > 0:
-                    self.draw_stroke(cr, self.current_stroke)
-                
-                if self.shape_preview:
-                    self.draw_shape(cr, self.shape_preview, preview=True)
-                
-                # Draw current text box being edited
-                if self.current_text_box:
-                    self.draw_text_box(cr, self.current_text_box, show_cursor=True)
-                
-                if self.selection_mode:
-                    if self.is_selecting:
-                        self.draw_selection_box(cr)
-                    if not self.selection.is_empty():
-                        self.draw_selection_bounds(cr)
-            
-            # Draw page number at bottom right corner
-            cr.set_source_rgba(0.6, 0.6, 0.6, 0.5)
-            cr.select_font_face("Sans", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_NORMAL)
-            cr.set_font_size(10 / self.zoom)
+            if not self.draw_cached_page(cr, page_num, page_width, page_height):
+                self.draw_page_content(cr, page_num, page_width, page_height)
+            cr.restore()
+        
+        # Draw page numbers at the bottom right corner
+        cr.set_source_rgba(0.6, 0.6, 0.6, 0.5)
+        cr.set_font_face(self._page_number_font)
+        cr.set_font_size(10 * inv_zoom)
+        for page_num, page_y in visible_pages:
             page_text = f"{page_num}"
             extents = cr.text_extents(page_text)
-            cr.move_to(page_width - extents.width - 15, page_height - 10)
+            cr.move_to(offset_x + page_width - extents.width - 15, page_y + page_height - 10)
             cr.show_text(page_text)
-            
-            cr.restore()
+        
+        # Draw live content on the current page: the stroke being drawn,
+        # shape preview, text box being edited and selection
+        if current_page_y is None:
+            return
+        
+        cr.save()
+        cr.translate(offset_x, current_page_y)
+        
+        if self.current_stroke and len(self.current_stroke.points) > 0:
+            self.draw_stroke(cr, self.current_stroke)
+        
+        if self.shape_preview:
+            self.draw_shape(cr, self.shape_preview, preview=True)
+        
+        if self.current_text_box:
+            self.draw_text_box(cr, self.current_text_box, show_cursor=True)
+        
+        if self.selection_mode:
+            if self.is_selecting:
+                self.draw_selection_box(cr)
+            if not self.selection.is_empty():
+                self.draw_selection_bounds(cr)
+        
+        cr.restore()
+    
+    def draw_page_content(self, cr, page_num, page_width, page_height):
+        """Draw a page's template and committed content over its background."""
+        # Draw template for this page
+        self.draw_page_template_at(cr, 0, 0, page_width, page_height)
+        
+        # Draw strokes for this page with proper layering
+        page_strokes = self.document.pages.get(page_num, [])
+        self.draw_strokes_by_layer(cr, page_strokes)
+        
+        # Draw shapes for this page
+        page_shapes = self.document.page_shapes.get(page_num, [])
+        self.draw_shapes(cr, page_shapes)
+        
+        # Draw text boxes for this page
+        page_text_boxes = self.document.page_text_boxes.get(page_num, [])
+        for text_box in page_text_boxes:
+            self.draw_text_box(cr, text_box)
+    
+    def draw_cached_page(self, cr, page_num, page_width, page_height):
+        """Paint a page's committed content from a cached render.
+        
+        The render is rebuilt after invalidate_page_cache() or when the zoom,
+        output scale, template or theme changes, so redraws while stroking,
+        panning or blinking the text cursor only blit one image per page.
+        Nothing is cached during a pinch, when the zoom changes every frame.
+        
+        Returns:
+            False if the page is too large to cache at the current zoom, or
+            a pinch is in progress
+        """
+        if self._page_cache_document is not self.document:
+            self._page_cache.clear()
+            self._page_cache_document = self.document
+        
+        target = cr.get_target()
+        scale = self.get_output_scale()
+        width = page_width * self.zoom
+        height = page_height * self.zoom
+        pixel_width = math.ceil(width * scale)
+        pixel_height = math.ceil(height * scale)
+        pixels = pixel_width * pixel_height
+        if pixels > PAGE_CACHE_MAX_PIXELS:
+            return False
+        
+        key = (self.zoom, scale, self.document.page_template, self.dark_mode)
+        cached = self._page_cache.pop(page_num, None)
+        if cached is not None and cached[0] != key:
+            cached = None
+        if cached is None and self.zooming:
+            # Draw directly (only the clip is rasterised) until zoom settles
+            return False
+        if cached is None:
+            # Transparent, so the page background and border show through
+            surface = target.create_similar_image(cairo.FORMAT_ARGB32, pixel_width, pixel_height)
+            surface.set_device_scale(scale, scale)
+            page_cr = cairo.Context(surface)
+            page_cr.scale(self.zoom, self.zoom)
+            self.draw_page_content(page_cr, page_num, page_width, page_height)
+            surface.flush()
+            cached = (key, surface, pixels)
+        
+        # Keep the most recently drawn pages at the end, dropping the least
+        # recently drawn ones once the cache is over its pixel budget
+        self._page_cache[page_num] = cached
+        total = sum(entry[2] for entry in self._page_cache.values())
+        while total > PAGE_CACHE_BUDGET_PIXELS:
+            oldest = next(iter(self._page_cache))
+            total -= self._page_cache.pop(oldest)[2]
+        
+        cr.save()
+        cr.scale(1 / self.zoom, 1 / self.zoom)
+        # Snap to whole pixels so the cached image is not resampled
+        device_x, device_y = cr.user_to_device(0, 0)
+        cr.translate(round(device_x) - device_x, round(device_y) - device_y)
+        cr.set_source_surface(cached[1], 0, 0)
+        cr.rectangle(0, 0, width, height)
+        cr.fill()
+        cr.restore()
+        return True
+    
+    def get_output_scale(self):
+        """Get the number of device pixels per widget pixel on screen.
+        
+        GTK hands draw handlers a recording surface whose device scale is
+        always 1, so cached images take their resolution from the widget's
+        surface instead.
+        """
+        native = self.get_native()
+        surface = native.get_surface() if native is not None else None
+        if surface is not None and hasattr(surface, 'get_scale'):
+            # Fractional scale, GTK 4.12 and later
+            return surface.get_scale()
+        return self.get_scale_factor()
+    
+    def invalidate_page_cache(self, all_pages=False):
+        """Drop the cached render of the current page (or of every page).
+        
+        Call after changing document content; this also drops the cached
+        stroke layers and grids used by draw_strokes_by_layer().
+        """
+        self._stroke_layers.clear()
+        self._stroke_grids.clear()
+        if all_pages:
+            self._page_cache.clear()
+        else:
+            self._page_cache.pop(self.document.current_page, None)
     
     def draw_page_boundary(self, cr, canvas_width, canvas_height):
         """Draw page boundary for A4 notes (legacy method - now using draw_all_pages)."""
@@ -542,42 +913,41 @@ class DrawingCanvas(Gtk.DrawingArea):
     
     def draw_page_template_at(self, cr, x, y, page_width, page_height):
         """Draw the template pattern at a specific position."""
-        from .stroke import PageTemplate
-        
         cr.save()
         
         # Set template line color (light gray/blue)
         if self.dark_mode:
-            cr.set_source_rgba(0.3, 0.3, 0.35, 0.4)
+            color = (0.3, 0.3, 0.35, 0.4)
         else:
-            cr.set_source_rgba(0.7, 0.75, 0.85, 0.5)
+            color = (0.7, 0.75, 0.85, 0.5)
+        cr.set_source_rgba(*color)
         
         template = self.document.page_template
+        inv_zoom = 1.0 / self.zoom  # Scales screen-pixel sizes to page units
         
         if template == PageTemplate.RULED:
             # Draw horizontal lines like ruled notebook paper
             line_spacing = 30  # pixels between lines
             margin_top = 50  # top margin before lines start
             
-            cr.set_line_width(0.5 / self.zoom)  # Adjust for zoom
+            cr.set_line_width(0.5 * inv_zoom)  # Adjust for zoom
             line_y = margin_top
             while line_y < page_height - 20:
                 cr.move_to(x + 40, line_y)
                 cr.line_to(x + page_width - 40, line_y)
-                cr.stroke()
                 line_y += line_spacing
+            cr.stroke()
         
         elif template == PageTemplate.GRID:
             # Draw square grid
             grid_size = 25  # pixels per grid square
-            cr.set_line_width(0.3 / self.zoom)  # Adjust for zoom
+            cr.set_line_width(0.3 * inv_zoom)  # Adjust for zoom
             
             # Vertical lines
             grid_x = 0
             while grid_x <= page_width:
                 cr.move_to(x + grid_x, y)
                 cr.line_to(x + grid_x, y + page_height)
-                cr.stroke()
                 grid_x += grid_size
             
             # Horizontal lines
@@ -585,39 +955,139 @@ class DrawingCanvas(Gtk.DrawingArea):
             while grid_y <= page_height:
                 cr.move_to(x, y + grid_y)
                 cr.line_to(x + page_width, y + grid_y)
-                cr.stroke()
                 grid_y += grid_size
+            cr.stroke()
         
         elif template == PageTemplate.DOT_GRID:
             # Draw dot grid pattern
             dot_spacing = 20  # pixels between dots
-            dot_radius = 1.0 / self.zoom  # dot size adjusted for zoom
             
-            dot_x = dot_spacing
-            while dot_x < page_width:
-                dot_y = dot_spacing
-                while dot_y < page_height:
-                    cr.arc(x + dot_x, y + dot_y, dot_radius, 0, 2 * 3.14159)
-                    cr.fill()
-                    dot_y += dot_spacing
-                dot_x += dot_spacing
+            # Dots sit at every multiple of the spacing inside the page; fill
+            # the cells around them with one repeating dot tile
+            columns = math.ceil(page_width / dot_spacing) - 1
+            rows = math.ceil(page_height / dot_spacing) - 1
+            half = dot_spacing / 2
+            cr.set_source(self.get_dot_pattern(cr, dot_spacing, color, x + half, y + half))
+            cr.rectangle(x + half, y + half, columns * dot_spacing, rows * dot_spacing)
+            cr.fill()
         
         # PageTemplate.BLANK draws nothing (just white background)
         
         cr.restore()
     
+    def get_dot_pattern(self, cr, dot_spacing, color, origin_x, origin_y):
+        """Get a repeating pattern with one dot centred in each grid cell.
+        
+        The tile is rendered at the output resolution for the current zoom
+        and reused until the zoom, scale or colour changes.
+        """
+        inv_zoom = 1.0 / self.zoom
+        tile_size = max(1, round(dot_spacing * self.zoom * self.get_output_scale()))
+        key = (tile_size, self.zoom, color)
+        if self._dot_pattern is None or self._dot_pattern[0] != key:
+            surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, tile_size, tile_size)
+            tile_cr = cairo.Context(surface)
+            tile_cr.scale(tile_size / dot_spacing, tile_size / dot_spacing)
+            tile_cr.set_source_rgba(*color)
+            # One dot, sized for zoom like the rest of the template. At about
+            # a pixel across a square covers the same pixels as a circle.
+            dot_radius = inv_zoom
+            center = dot_spacing / 2
+            if dot_radius * tile_size / dot_spacing <= 1.0:
+                tile_cr.rectangle(center - dot_radius, center - dot_radius, 2 * dot_radius, 2 * dot_radius)
+            else:
+                tile_cr.arc(center, center, dot_radius, 0, math.tau)
+            tile_cr.fill()
+            pattern = cairo.SurfacePattern(surface)
+            pattern.set_extend(cairo.EXTEND_REPEAT)
+            self._dot_pattern = (key, pattern, tile_size / dot_spacing)
+        
+        _, pattern, tile_scale = self._dot_pattern
+        # Map user space onto the tile grid, starting at the first cell
+        matrix = cairo.Matrix(xx=tile_scale, yy=tile_scale)
+        matrix.translate(-origin_x, -origin_y)
+        pattern.set_matrix(matrix)
+        return pattern
+    
     def draw_strokes_by_layer(self, cr, strokes):
         """Draw strokes in proper z-order: highlighters first, then others."""
         # Layer 1: Highlighters (background layer)
-        for stroke in strokes:
-            if stroke.pen_type == PenType.HIGHLIGHTER:
-                self.draw_stroke(cr, stroke)
-        
         # Layer 2: Regular strokes (pens, pencils) on top
-        # Skip eraser strokes - they should never be drawn
+        highlighters, ink = self.get_stroke_layers(strokes)
+        
+        # Skip strokes entirely outside the area being redrawn. Bounds are
+        # padded by one width; pad once more for wide highlighter caps.
+        clip_x1, clip_y1, clip_x2, clip_y2 = cr.clip_extents()
+        for layer in (highlighters, ink):
+            for stroke in self.get_strokes_near(layer, clip_x1, clip_y1, clip_x2, clip_y2):
+                min_x, min_y, max_x, max_y = stroke.get_bounds()
+                pad = stroke.width
+                if (max_x + pad >= clip_x1 and min_x - pad <= clip_x2 and
+                        max_y + pad >= clip_y1 and min_y - pad <= clip_y2):
+                    self.draw_stroke(cr, stroke)
+    
+    def get_strokes_near(self, strokes, x1, y1, x2, y2):
+        """Get the strokes that may reach into a rectangle, in drawing order.
+        
+        Large stroke lists are indexed with a grid kept until
+        invalidate_page_cache(), so only strokes in the cells the rectangle
+        covers are returned; callers still test each stroke's bounds.
+        """
+        if len(strokes) < STROKE_GRID_MIN_STROKES:
+            return strokes
+        
+        cached = self._stroke_grids.get(id(strokes))
+        if cached is None or cached[0] is not strokes:
+            cached = (strokes,) + _build_stroke_grid(strokes)
+            self._stroke_grids[id(strokes)] = cached
+        _, grid, large = cached
+        
+        cell = STROKE_GRID_CELL
+        cell_x1 = int(x1 // cell)
+        cell_y1 = int(y1 // cell)
+        cell_x2 = int(x2 // cell)
+        cell_y2 = int(y2 // cell)
+        if (cell_x2 - cell_x1 + 1) * (cell_y2 - cell_y1 + 1) > len(grid):
+            # Visiting the cells would cost more than testing every stroke
+            return strokes
+        
+        found = set(large)
+        for cell_x in range(cell_x1, cell_x2 + 1):
+            for cell_y in range(cell_y1, cell_y2 + 1):
+                indices = grid.get((cell_x, cell_y))
+                if indices:
+                    found.update(indices)
+        return [strokes[index] for index in sorted(found)]
+    
+    def get_stroke_layers(self, strokes):
+        """Split a stroke list into highlighter and ink layers.
+        
+        Eraser strokes are left out, they are never drawn. The split is kept
+        per list until invalidate_page_cache(), so redraws of unchanged
+        content do not re-test every stroke's pen type.
+        
+        Returns:
+            Tuple of (highlighter strokes, other strokes), in drawing order
+        """
+        cached = self._stroke_layers.get(id(strokes))
+        if cached is not None and cached[0] is strokes:
+            return cached[1], cached[2]
+        
+        # Partition in a single pass
+        highlighters = []
+        ink = []
+        add_highlighter = highlighters.append
+        add_ink = ink.append
+        highlighter = PenType.HIGHLIGHTER
+        eraser = PenType.ERASER
         for stroke in strokes:
-            if stroke.pen_type != PenType.HIGHLIGHTER and stroke.pen_type != PenType.ERASER:
-                self.draw_stroke(cr, stroke)
+            pen_type = stroke.pen_type
+            if pen_type is highlighter:
+                add_highlighter(stroke)
+            elif pen_type is not eraser:
+                add_ink(stroke)
+        self._stroke_layers[id(strokes)] = (strokes, highlighters, ink)
+        return highlighters, ink
     
     def draw_stroke(self, cr, stroke: Stroke):
         """Draw a single stroke."""
@@ -634,7 +1104,7 @@ class DrawingCanvas(Gtk.DrawingArea):
                     cr.set_source_rgba(stroke.color[0], stroke.color[1], stroke.color[2], 0.4)
                 else:
                     cr.set_source_rgba(*stroke.color)
-                cr.arc(p.x, p.y, stroke.width / 2, 0, 2 * 3.14159)
+                cr.arc(p.x, p.y, stroke.width / 2, 0, math.tau)
                 cr.fill()
             return
         
@@ -655,63 +1125,121 @@ class DrawingCanvas(Gtk.DrawingArea):
             cr.set_line_cap(cairo.LINE_CAP_ROUND)
             cr.set_line_join(cairo.LINE_JOIN_ROUND)
         
-        # Draw the stroke with variable width based on pressure
-        for i in range(len(stroke.points) - 1):
-            p1 = stroke.points[i]
-            p2 = stroke.points[i + 1]
-            
-            # Calculate width based on pressure and pen type
-            if stroke.pen_type == PenType.HIGHLIGHTER:
-                # Highlighter is wider and more uniform
-                width = stroke.width * 2.5  # Make highlighter thicker
-            elif stroke.pen_type == PenType.PENCIL:
-                # Pencil has more pressure variation and is slightly thinner
-                width = stroke.width * p1.pressure * 0.8
-                
-                # Apply tilt-based width variation (simulates pencil angle)
-                # Higher tilt values (pen tilted) = wider stroke (shading)
-                tilt_magnitude = (p1.tilt_x ** 2 + p1.tilt_y ** 2) ** 0.5
-                if tilt_magnitude > 0.1:  # If tilt is significant
-                    # Increase width up to 1.5x when tilted
-                    tilt_factor = 1.0 + (tilt_magnitude * 0.5)
-                    width *= tilt_factor
-                    # Reduce opacity slightly when tilted (lighter shading)
-                    tilt_opacity = max(0.6, 1.0 - (tilt_magnitude * 0.2))
-                    cr.set_source_rgba(stroke.color[0], stroke.color[1], stroke.color[2], 
-                                     stroke.color[3] * tilt_opacity)
-                
-                # Add slight variation for texture
-                import random
-                random.seed(int(p1.x * p1.y))  # Deterministic randomness
-                width *= (0.9 + random.random() * 0.2)
-            else:
-                # Pen has normal pressure response
-                width = stroke.width * p1.pressure
+        xs, ys, pressures, _, _ = stroke.get_columns()
+        
+        if stroke.pen_type == PenType.HIGHLIGHTER:
+            # Highlighter is wider and uniform - build one path, stroke once
+            cr.set_line_width(max(0.5, stroke.width * 2.5))
+            cr.move_to(xs[0], ys[0])
+            line_to = cr.line_to
+            for x, y in zip(xs[1:], ys[1:]):
+                line_to(x, y)
+            cr.stroke()
+            return
+        
+        if stroke.pen_type != PenType.PENCIL:
+            # Pen has normal pressure response. Consecutive segments whose
+            # width rounds to the same quarter pixel share one path, so a
+            # stroke is only split where the width visibly changes.
+            scale = stroke.width * 4
+            line_width = None
+            last_x = xs[0]
+            last_y = ys[0]
+            line_to = cr.line_to
+            # Each segment takes its width from the pressure at its start
+            for x, y, pressure in zip(xs[1:], ys[1:], pressures):
+                width = max(0.5, round(scale * pressure) / 4)
+                if width != line_width:
+                    if line_width is not None:
+                        cr.stroke()
+                    cr.set_line_width(width)
+                    cr.move_to(last_x, last_y)
+                    line_width = width
+                line_to(x, y)
+                last_x = x
+                last_y = y
+            cr.stroke()
+            return
+        
+        # Pencil: width and opacity vary per segment with pressure and tilt
+        widths, opacities = _pencil_segments(stroke)
+        red, green, blue, alpha = stroke.color
+        opacity = 1.0
+        for i, (width, segment_opacity) in enumerate(zip(widths, opacities)):
+            x1 = xs[i]
+            y1 = ys[i]
+            x2 = xs[i + 1]
+            y2 = ys[i + 1]
+            
+            if segment_opacity != opacity:
+                cr.set_source_rgba(red, green, blue, alpha * segment_opacity)
+                opacity = segment_opacity
             
             cr.set_line_width(max(0.5, width))
-            cr.move_to(p1.x, p1.y)
-            cr.line_to(p2.x, p2.y)
+            cr.move_to(x1, y1)
+            cr.line_to(x2, y2)
             cr.stroke()
             
-            # For pencil, add texture with additional faint lines
-            if stroke.pen_type == PenType.PENCIL and i % 2 == 0:
+            # Add texture with additional faint lines
+            if i % 2 == 0:
                 cr.save()
-                cr.set_source_rgba(stroke.color[0], stroke.color[1], stroke.color[2], 0.1)
+                cr.set_source_rgba(red, green, blue, 0.1)
                 cr.set_line_width(max(0.3, width * 0.5))
                 # Slight offset for texture
                 offset = 0.5
-                cr.move_to(p1.x + offset, p1.y + offset)
-                cr.line_to(p2.x + offset, p2.y + offset)
+                cr.move_to(x1 + offset, y1 + offset)
+                cr.line_to(x2 + offset, y2 + offset)
                 cr.stroke()
                 cr.restore()
     
+    def draw_shapes(self, cr, shapes):
+        """Draw committed shapes in order.
+        
+        Consecutive opaque shapes with the same colour, line style, width and
+        fill share one path, so the style is set and the path filled or
+        stroked once per run instead of once per shape.
+        """
+        run_style = None
+        for shape in shapes:
+            if shape.shape_type == ShapeType.ARROW or shape.color[3] < 1.0:
+                # Arrows mix a stroke and a fill, and translucent shapes must
+                # blend where they overlap - draw these on their own
+                style = None
+            else:
+                style = (shape.color, shape.line_style, shape.width, self.is_shape_filled(shape))
+            
+            if style is None or style != run_style:
+                if run_style is not None:
+                    self.finish_shape_path(cr, run_style[3])
+                    cr.restore()
+                    run_style = None
+                if style is None:
+                    self.draw_shape(cr, shape)
+                    continue
+                cr.save()
+                self.set_shape_style(cr, shape)
+                run_style = style
+            
+            self.add_shape_path(cr, shape)
+        
+        if run_style is not None:
+            self.finish_shape_path(cr, run_style[3])
+            cr.restore()
+    
     def draw_shape(self, cr, shape: Shape, preview=False):
         """Draw a geometric shape."""
-        import math
-        
         cr.save()
+        self.set_shape_style(cr, shape, preview)
+        
+        if shape.shape_type == ShapeType.ARROW:
+            self.draw_arrow(cr, shape)
+        elif self.add_shape_path(cr, shape):
+            self.finish_shape_path(cr, self.is_shape_filled(shape))
         
-        # Set color and line properties
+        cr.restore()
+    
+    def set_shape_style(self, cr, shape: Shape, preview=False):
+        """Set the colour and line properties for drawing a shape."""
         if preview:
             # Preview with dashed line
             cr.set_source_rgba(*shape.color[:3], 0.6)
@@ -728,7 +1256,28 @@ class DrawingCanvas(Gtk.DrawingArea):
         cr.set_line_width(shape.width)
         cr.set_line_cap(cairo.LINE_CAP_ROUND)
         cr.set_line_join(cairo.LINE_JOIN_ROUND)
+    
+    @staticmethod
+    def is_shape_filled(shape: Shape) -> bool:
+        """Whether a shape is filled rather than stroked (lines never are)."""
+        return shape.filled and shape.shape_type != ShapeType.STRAIGHT_LINE
+    
+    @staticmethod
+    def finish_shape_path(cr, filled):
+        """Fill or stroke the shape path built so far."""
+        if filled:
+            cr.fill()
+        else:
+            cr.stroke()
+    
+    def add_shape_path(self, cr, shape: Shape) -> bool:
+        """Add the outline of a shape to the current path.
+        
+        Arrows are drawn by draw_arrow() instead.
         
+        Returns:
+            False if the shape is too small to have an outline
+        """
         x1, y1 = shape.start_x, shape.start_y
         x2, y2 = shape.end_x, shape.end_y
         
@@ -736,17 +1285,12 @@ class DrawingCanvas(Gtk.DrawingArea):
             # Draw straight line
             cr.move_to(x1, y1)
             cr.line_to(x2, y2)
-            cr.stroke()
             
         elif shape.shape_type == ShapeType.RECTANGLE:
             # Draw rectangle
             width = x2 - x1
             height = y2 - y1
             cr.rectangle(x1, y1, width, height)
-            if shape.filled:
-                cr.fill()
-            else:
-                cr.stroke()
                 
         elif shape.shape_type == ShapeType.CIRCLE:
             # Draw circle/ellipse
@@ -755,39 +1299,29 @@ class DrawingCanvas(Gtk.DrawingArea):
             rx = abs(x2 - x1) / 2
             ry = abs(y2 - y1) / 2
             
-            # Prevent invalid matrix error when radius is zero
+            # Nothing to draw for a degenerate ellipse
             if rx < 0.1 or ry < 0.1:
-                return
-            
-            # Draw ellipse using arc transformations
-            cr.save()
-            cr.translate(cx, cy)
-            cr.scale(rx, ry)
-            cr.arc(0, 0, 1, 0, 2 * math.pi)
-            cr.restore()
-            
-            if shape.filled:
-                cr.fill()
-            else:
-                cr.stroke()
+                return False
+            
+            # Draw ellipse as four cubic Bézier quarter arcs
+            kx = rx * _ELLIPSE_KAPPA
+            ky = ry * _ELLIPSE_KAPPA
+            cr.move_to(cx + rx, cy)
+            cr.curve_to(cx + rx, cy + ky, cx + kx, cy + ry, cx, cy + ry)
+            cr.curve_to(cx - kx, cy + ry, cx - rx, cy + ky, cx - rx, cy)
+            cr.curve_to(cx - rx, cy - ky, cx - kx, cy - ry, cx, cy - ry)
+            cr.curve_to(cx + kx, cy - ry, cx + rx, cy - ky, cx + rx, cy)
+            cr.close_path()
                 
         elif shape.shape_type == ShapeType.TRIANGLE:
             # Draw equilateral triangle
             cx = (x1 + x2) / 2
-            cy = (y1 + y2) / 2
-            height = abs(y2 - y1)
-            width = abs(x2 - x1)
             
             # Three points of triangle
             cr.move_to(cx, y1)  # Top point
             cr.line_to(x1, y2)  # Bottom left
             cr.line_to(x2, y2)  # Bottom right
             cr.close_path()
-            
-            if shape.filled:
-                cr.fill()
-            else:
-                cr.stroke()
                 
         elif shape.shape_type == ShapeType.PENTAGON:
             # Draw regular pentagon
@@ -796,10 +1330,9 @@ class DrawingCanvas(Gtk.DrawingArea):
             radius = min(abs(x2 - x1), abs(y2 - y1)) / 2
             
             # Pentagon has 5 sides, starting from top
-            for i in range(5):
-                angle = (i * 2 * math.pi / 5) - math.pi / 2  # Start from top
-                px = cx + radius * math.cos(angle)
-                py = cy + radius * math.sin(angle)
+            for i, (ux, uy) in enumerate(_PENTAGON_UNIT):
+                px = cx + radius * ux
+                py = cy + radius * uy
                 
                 if i == 0:
                     cr.move_to(px, py)
@@ -807,68 +1340,76 @@ class DrawingCanvas(Gtk.DrawingArea):
                     cr.line_to(px, py)
             
             cr.close_path()
-            
-            if shape.filled:
-                cr.fill()
-            else:
-                cr.stroke()
-                
-        elif shape.shape_type == ShapeType.ARROW:
-            # Draw arrow from start to end point
-            # Calculate arrow direction
-            dx = x2 - x1
-            dy = y2 - y1
-            length = math.sqrt(dx * dx + dy * dy)
-            
-            if length > 0:
-                # Normalize direction
-                dx /= length
-                dy /= length
-                
-                # Arrow dimensions
-                arrow_head_length = min(20, length * 0.3)  # 30% of line or 20px
-                arrow_head_width = arrow_head_length * 0.6
-                
-                # Draw main line
-                cr.move_to(x1, y1)
-                cr.line_to(x2, y2)
-                cr.stroke()
-                
-                # Calculate arrow head points
-                # Perpendicular vector
-                perp_x = -dy
-                perp_y = dx
-                
-                # Arrow head tip is at end point
-                # Calculate base of arrow head
-                base_x = x2 - dx * arrow_head_length
-                base_y = y2 - dy * arrow_head_length
-                
-                # Two points at the base
-                p1_x = base_x + perp_x * arrow_head_width / 2
-                p1_y = base_y + perp_y * arrow_head_width / 2
-                p2_x = base_x - perp_x * arrow_head_width / 2
-                p2_y = base_y - perp_y * arrow_head_width / 2
-                
-                # Draw arrow head (filled triangle)
-                cr.move_to(x2, y2)
-                cr.line_to(p1_x, p1_y)
-                cr.line_to(p2_x, p2_y)
-                cr.close_path()
-                cr.fill()
         
-        cr.restore()
+        else:
+            return False
+        
+        return True
+    
+    def draw_arrow(self, cr, shape: Shape):
+        """Draw an arrow shape: a stroked line and a filled head."""
+        x1, y1 = shape.start_x, shape.start_y
+        x2, y2 = shape.end_x, shape.end_y
+        
+        # Draw arrow from start to end point
+        # Calculate arrow direction
+        dx = x2 - x1
+        dy = y2 - y1
+        length = math.hypot(dx, dy)
+        
+        if length > 0:
+            # Normalize direction
+            inv_length = 1.0 / length
+            dx *= inv_length
+            dy *= inv_length
+            
+            # Arrow dimensions
+            arrow_head_length = min(20, length * 0.3)  # 30% of line or 20px
+            half_head_width = arrow_head_length * 0.3  # Head is 0.6x as wide as long
+            
+            # Draw main line
+            cr.move_to(x1, y1)
+            cr.line_to(x2, y2)
+            cr.stroke()
+            
+            # Calculate arrow head points
+            # Perpendicular vector
+            perp_x = -dy
+            perp_y = dx
+            
+            # Arrow head tip is at end point
+            # Calculate base of arrow head
+            base_x = x2 - dx * arrow_head_length
+            base_y = y2 - dy * arrow_head_length
+            
+            # Two points at the base
+            p1_x = base_x + perp_x * half_head_width
+            p1_y = base_y + perp_y * half_head_width
+            p2_x = base_x - perp_x * half_head_width
+            p2_y = base_y - perp_y * half_head_width
+            
+            # Draw arrow head (filled triangle)
+            cr.move_to(x2, y2)
+            cr.line_to(p1_x, p1_y)
+            cr.line_to(p2_x, p2_y)
+            cr.close_path()
+            cr.fill()
     
     def draw_selection_box(self, cr):
         """Draw the selection box while selecting."""
+        if not self.is_selecting:
+            return
+        
         cr.save()
         
         # Draw semi-transparent blue selection box
         cr.set_source_rgba(0.2, 0.5, 0.9, 0.2)
-        x1 = min(self.selection_box_start_x, self.selection_box_end_x)
-        y1 = min(self.selection_box_start_y, self.selection_box_end_y)
-        x2 = max(self.selection_box_start_x, self.selection_box_end_x)
-        y2 = max(self.selection_box_start_y, self.selection_box_end_y)
+        x1, x2 = self.selection_box_start_x, self.selection_box_end_x
+        if x2 < x1:
+            x1, x2 = x2, x1
+        y1, y2 = self.selection_box_start_y, self.selection_box_end_y
+        if y2 < y1:
+            y1, y2 = y2, y1
         cr.rectangle(x1, y1, x2 - x1, y2 - y1)
         cr.fill()
         
@@ -898,26 +1439,16 @@ class DrawingCanvas(Gtk.DrawingArea):
         
         # Draw resize handles at corners and midpoints
         handle_size = 8
-        handles = [
-            (min_x, min_y),  # Top-left
-            ((min_x + max_x) / 2, min_y),  # Top-middle
-            (max_x, min_y),  # Top-right
-            (max_x, (min_y + max_y) / 2),  # Right-middle
-            (max_x, max_y),  # Bottom-right
-            ((min_x + max_x) / 2, max_y),  # Bottom-middle
-            (min_x, max_y),  # Bottom-left
-            (min_x, (min_y + max_y) / 2),  # Left-middle
-        ]
         
-        cr.set_source_rgba(1.0, 1.0, 1.0, 1.0)  # White fill
-        for hx, hy in handles:
+        # All handles share one path: filled once, then stroked once
+        for hx, hy in self.selection.get_handles():
             cr.rectangle(hx - handle_size/2, hy - handle_size/2, handle_size, handle_size)
-            cr.fill()
+        
+        cr.set_source_rgba(1.0, 1.0, 1.0, 1.0)  # White fill
+        cr.fill_preserve()
         
         cr.set_source_rgba(0.2, 0.5, 0.9, 1.0)  # Blue border
-        for hx, hy in handles:
-            cr.rectangle(hx - handle_size/2, hy - handle_size/2, handle_size, handle_size)
-            cr.stroke()
+        cr.stroke()
         
         cr.restore()
     
@@ -930,16 +1461,15 @@ class DrawingCanvas(Gtk.DrawingArea):
         device = gesture.get_device()
         source = device.get_source()
         source_value = int(source)
-        source_name = {1: "MOUSE", 2: "PEN", 3: "TOUCHSCREEN", 4: "TOUCHPAD", 
-                      5: "TRACKPOINT", 6: "TABLET_PAD"}.get(source_value, f"UNKNOWN({source_value})")
+        source_name = _source_name(source_value)
         
-        logger.info(f"Stylus gesture: DOWN at ({x:.2f}, {y:.2f}), device: {device.get_name()}, source: {source_name}")
+        logger.info("Stylus gesture: DOWN at (%.2f, %.2f), device: %s, source: %s", x, y, device.get_name(), source_name)
         
         # Check for stylus eraser button or eraser tool
         tool = device.get_device_tool() if device and hasattr(device, 'get_device_tool') else None
         if tool and hasattr(tool, 'get_tool_type'):
             tool_type = tool.get_tool_type()
-            logger.info(f"Stylus tool type: {tool_type}")
+            logger.info("Stylus tool type: %s", tool_type)
             
             # Auto-switch to eraser if stylus eraser is being used
             if tool_type == Gdk.DeviceToolType.ERASER:
@@ -959,7 +1489,7 @@ class DrawingCanvas(Gtk.DrawingArea):
                     # Some stylus drivers report eraser via tool type change
                     pass  # Already handled above
         except Exception as e:
-            logger.debug(f"Could not check stylus button: {e}")
+            logger.debug("Could not check stylus button: %s", e)
         
         # Claim this event sequence to prevent other gestures from handling it
         gesture.set_state(Gtk.EventSequenceState.CLAIMED)
@@ -967,7 +1497,7 @@ class DrawingCanvas(Gtk.DrawingArea):
         # IMPORTANT: If GestureStylus fires, it means GTK detected stylus-like input
         # Trust the gesture handler - don't block it even if source says TOUCHSCREEN
         # This handles cases where Wayland reports stylus as "Wayland Touch Logical Pointer"
-        logger.info(f"✓ Allowing stylus gesture (GestureStylus handler = stylus input)")
+        logger.info("✓ Allowing stylus gesture (GestureStylus handler = stylus input)")
         
         # Note: We removed the palm rejection check here because if GestureStylus
         # fires, it's stylus input by definition, regardless of what the source says
@@ -994,12 +1524,39 @@ class DrawingCanvas(Gtk.DrawingArea):
         tilt_x = gesture.get_axis(Gdk.AxisUse.XTILT)
         tilt_y = gesture.get_axis(Gdk.AxisUse.YTILT)
         
+        # GTK merges stylus motion into one event per frame; add the merged
+        # samples to a pen stroke first so fast strokes keep their shape,
+        # then redraw once for the whole batch
+        stroke = self.current_stroke
+        if stroke is not None and stroke.pen_type != PenType.ERASER:
+            self.add_stylus_backlog(gesture)
+        
         self.continue_stroke(x, y, pressure, tilt_x or 0.0, tilt_y or 0.0)
         return True
     
+    def add_stylus_backlog(self, gesture):
+        """Feed the motion samples GTK coalesced into the current event to
+        continue_stroke() without queueing a redraw for each one."""
+        try:
+            success, backlog = gesture.get_backlog()
+        except Exception as e:
+            logger.debug("Could not read stylus backlog: %s", e)
+            return
+        if not success:
+            return
+        
+        for coord in backlog:
+            axes = coord.axes
+            flags = coord.flags
+            pressure = axes[Gdk.AxisUse.PRESSURE] if flags & Gdk.AxisFlags.PRESSURE else 1.0
+            self.continue_stroke(axes[Gdk.AxisUse.X], axes[Gdk.AxisUse.Y], pressure,
+                                 axes[Gdk.AxisUse.XTILT], axes[Gdk.AxisUse.YTILT],
+                                 redraw=False)
+        self.queue_draw()
+    
     def on_stylus_up(self, gesture, x, y):
         """Handle stylus up event."""
-        logger.info(f"Stylus gesture: UP at ({x:.2f}, {y:.2f})")
+        logger.info("Stylus gesture: UP at (%.2f, %.2f)", x, y)
         
         # Claim this event sequence
         gesture.set_state(Gtk.EventSequenceState.CLAIMED)
@@ -1021,14 +1578,13 @@ class DrawingCanvas(Gtk.DrawingArea):
             
             if source:
                 source_value = int(source)
-                source_name = {1: "MOUSE", 2: "PEN", 3: "TOUCHSCREEN", 4: "TOUCHPAD", 
-                              5: "TRACKPOINT", 6: "TABLET_PAD"}.get(source_value, f"UNKNOWN({source_value})")
+                source_name = _source_name(source_value)
                 
                 device_name = device.get_name() if device else "Unknown"
                 
                 if event_type == Gdk.EventType.BUTTON_PRESS:
                     x, y = event.get_position()
-                    logger.info(f"LEGACY EVENT: PRESS from '{device_name}' | Source: {source_name} | Position: ({x:.1f}, {y:.2f})")
+                    logger.info("LEGACY EVENT: PRESS from '%s' | Source: %s | Position: (%.1f, %.2f)", device_name, source_name, x, y)
                     
                     # Don't draw if in text mode
                     if self.text_mode:
@@ -1036,11 +1592,11 @@ class DrawingCanvas(Gtk.DrawingArea):
                     
                     # Handle stylus input here
                     if self.palm_rejection_mode and source != Gdk.InputSource.PEN:
-                        logger.warning(f"❌ BLOCKED {source_name} in legacy handler")
+                        logger.warning("❌ BLOCKED %s in legacy handler", source_name)
                         return True  # Block the event
                     
                     # Start drawing
-                    logger.info(f"✓ Starting stroke from legacy handler")
+                    logger.info("✓ Starting stroke from legacy handler")
                     self.start_stroke(x, y, 1.0)
                     return True  # Consume the event
                     
@@ -1050,7 +1606,7 @@ class DrawingCanvas(Gtk.DrawingArea):
                     return True
                     
                 elif event_type == Gdk.EventType.BUTTON_RELEASE and self.is_drawing:
-                    logger.info(f"LEGACY EVENT: RELEASE - ending stroke")
+                    logger.info("LEGACY EVENT: RELEASE - ending stroke")
                     self.end_stroke()
                     return True
         
@@ -1069,6 +1625,7 @@ class DrawingCanvas(Gtk.DrawingArea):
                 self.document.add_text_box(self.current_text_box)
                 self.undo_stack.append(('text_box', self.current_text_box))
                 self.redo_stack.clear()
+                self.invalidate_page_cache()
             
             # Create new text box at click position
             self.current_text_box = TextBox(
@@ -1092,10 +1649,9 @@ class DrawingCanvas(Gtk.DrawingArea):
         source = device.get_source() if device else None
         device_name = device.get_name() if device else "Unknown"
         source_value = int(source) if source else -1
-        source_name = {1: "MOUSE", 2: "PEN", 3: "TOUCHSCREEN", 4: "TOUCHPAD", 
-                      5: "TRACKPOINT", 6: "TABLET_PAD"}.get(source_value, f"UNKNOWN({source_value})")
+        source_name = _source_name(source_value)
         
-        logger.info(f"🔵 CLICK PRESSED: device='{device_name}', source={source_name}, pos=({x:.1f}, {y:.1f})")
+        logger.info("🔵 CLICK PRESSED: device='%s', source=%s, pos=(%.1f, %.1f)", device_name, source_name, x, y)
         
         # Check palm rejection (only for single-touch drawing)
         if self.palm_rejection_mode:
@@ -1106,19 +1662,19 @@ class DrawingCanvas(Gtk.DrawingArea):
             # Block single-touch touchscreen, but allow stylus even with UNKNOWN source
             # Multi-touch gestures are handled by separate zoom gesture controller
             if (source == Gdk.InputSource.TOUCHSCREEN or source_value == 3) and not is_stylus_by_name:
-                logger.warning(f"❌ BLOCKED TOUCHSCREEN in click handler (single-touch)")
+                logger.warning("❌ BLOCKED TOUCHSCREEN in click handler (single-touch)")
                 gesture.set_state(Gtk.EventSequenceState.DENIED)
                 return True
         
         # Claim the gesture and start drawing
         gesture.set_state(Gtk.EventSequenceState.CLAIMED)
-        logger.info(f"✓ Starting drawing from click handler")
+        logger.info("✓ Starting drawing from click handler")
         self.start_stroke(x, y, 1.0)
         return True
     
     def on_click_released(self, gesture, n_press, x, y):
         """Simple click detector to log all button releases."""
-        logger.info(f"🔴 CLICK RELEASED at ({x:.1f}, {y:.1f})")
+        logger.info("🔴 CLICK RELEASED at (%.1f, %.1f)", x, y)
         if self.is_drawing:
             self.end_stroke()
         return True
@@ -1164,11 +1720,17 @@ class DrawingCanvas(Gtk.DrawingArea):
         # Multi-touch zoom should always work, even with palm rejection
         # We only block single-touch drawing when palm rejection is on
         self.zoom_start = self.zoom
-        logger.info(f"Zoom gesture begin at zoom level {self.zoom:.2f}")
+        self.zooming = True
+        logger.info("Zoom gesture begin at zoom level %.2f", self.zoom)
         # Claim this gesture to ensure it's not blocked by palm rejection
         gesture.set_state(Gtk.EventSequenceState.CLAIMED)
         return True
     
+    def on_zoom_end(self, gesture, sequence):
+        """Handle zoom gesture end: cache pages again at the settled zoom."""
+        self.zooming = False
+        self.queue_draw()
+    
     def on_zoom_changed(self, gesture, scale):
         """Handle pinch-to-zoom gesture with smooth scaling."""
         # Calculate new zoom level with improved sensitivity
@@ -1176,7 +1738,6 @@ class DrawingCanvas(Gtk.DrawingArea):
         new_zoom = self.zoom_start * scale
         
         # Clamp zoom between 0.5x and 5x for A4 pages (reasonable range)
-        from .stroke import NoteType
         if self.document.note_type == NoteType.A4_NOTES:
             fit_zoom = self.calculate_fit_zoom()
             min_zoom = max(0.3, fit_zoom * 0.5)  # Don't zoom out too much
@@ -1225,8 +1786,7 @@ class DrawingCanvas(Gtk.DrawingArea):
         
         # Map source values to readable names
         source_value = int(source)
-        source_name = {1: "MOUSE", 2: "PEN", 3: "TOUCHSCREEN", 4: "TOUCHPAD", 
-                      5: "TRACKPOINT", 6: "TABLET_PAD"}.get(source_value, f"UNKNOWN({source_value})")
+        source_name = _source_name(source_value)
         
         # Check if device has stylus capability by checking if we can get axes
         has_pressure = False
@@ -1249,7 +1809,7 @@ class DrawingCanvas(Gtk.DrawingArea):
         tool_type = tool.get_tool_type() if tool and hasattr(tool, 'get_tool_type') else None
         
         # Always log input source for debugging
-        logger.info(f"Input from device '{device_name}' | Source: {source_name} | Pressure: {has_pressure} | Tool: {tool_type}")
+        logger.info("Input from device '%s' | Source: %s | Pressure: %s | Tool: %s", device_name, source_name, has_pressure, tool_type)
         
         # Determine if this is a stylus input
         is_stylus = (source == Gdk.InputSource.PEN or is_stylus_by_name or 
@@ -1264,14 +1824,14 @@ class DrawingCanvas(Gtk.DrawingArea):
             
             # Block ONLY touchscreen (source 3), but allow stylus even with UNKNOWN source
             if (source == Gdk.InputSource.TOUCHSCREEN or source_value == 3) and not is_stylus_by_name_check:
-                logger.warning(f"❌ BLOCKED TOUCHSCREEN input (palm rejection active)")
+                logger.warning("❌ BLOCKED TOUCHSCREEN input (palm rejection active)")
                 gesture.set_state(Gtk.EventSequenceState.DENIED)
                 return
             else:
                 # Allow all other inputs (including stylus, mouse, touchpad)
-                logger.info(f"✓ Allowing input: device='{device_name}', source={source_name}, tool={tool_type}")
+                logger.info("✓ Allowing input: device='%s', source=%s, tool=%s", device_name, source_name, tool_type)
         
-        logger.info(f"Drawing stroke begin at ({x:.2f}, {y:.2f})")
+        logger.info("Drawing stroke begin at (%.2f, %.2f)", x, y)
         
         # Try to get pressure for stylus devices
         pressure = 1.0
@@ -1282,7 +1842,7 @@ class DrawingCanvas(Gtk.DrawingArea):
                 pressure_value = event.get_axis(Gdk.AxisUse.PRESSURE)
                 if pressure_value is not None:
                     pressure = pressure_value
-                    logger.info(f"Stylus pressure detected: {pressure:.3f}")
+                    logger.info("Stylus pressure detected: %.3f", pressure)
         
         self.start_stroke(x, y, pressure)
     
@@ -1328,41 +1888,44 @@ class DrawingCanvas(Gtk.DrawingArea):
         self.last_y = y
         
         # Transform coordinates
-        tx = (x - self.pan_x) / self.zoom
-        ty = (y - self.pan_y) / self.zoom
+        inv_zoom = 1.0 / self.zoom
+        tx = (x - self.pan_x) * inv_zoom
+        ty = (y - self.pan_y) * inv_zoom
         
         # Handle A4 notes - convert to page-relative coordinates
-        from .stroke import NoteType
-        if self.document.note_type == NoteType.A4_NOTES:
+        document = self.document
+        if document.note_type == NoteType.A4_NOTES:
             # Get page layout
             offset_x = self.get_page_layout(self.get_width())
-            page_height = self.document.height
+            page_height = document.height
             page_gap = 20  # Gap between pages
             top_padding = 30
             
-            # Adjust for page offset
+            # Calculate which page we're on
             tx = tx - offset_x
             ty_relative = ty - top_padding
-            
-            # Calculate which page we're on
             page_num = int(ty_relative / (page_height + page_gap)) + 1
             if page_num < 1:
                 page_num = 1
             
             # Update current page
-            self.document.current_page = page_num
+            document.current_page = page_num
             
             # Ensure page exists
-            if page_num not in self.document.pages:
-                self.document.pages[page_num] = []
-                self.document.page_shapes[page_num] = []
+            if page_num not in document.pages:
+                document.pages[page_num] = []
+                document.page_shapes[page_num] = []
             
-            # Convert to page-relative coordinates
-            ty = ty_relative - (page_num - 1) * (page_height + page_gap)
+            # Convert to page-relative coordinates, remembering the page
+            # origin so the rest of the stroke can reuse it
+            page_origin_y = top_padding + (page_num - 1) * (page_height + page_gap)
+            self._stroke_page_origin = (offset_x, page_origin_y)
+            ty = ty - page_origin_y
             
             # Clip to page boundaries
-            tx = max(0, min(self.document.width, tx))
-            ty = max(0, min(page_height, ty))
+            page_width = document.width
+            tx = 0 if tx < 0 else (page_width if tx > page_width else tx)
+            ty = 0 if ty < 0 else (page_height if ty > page_height else ty)
         
         if self.selection_mode:
             # Check if clicking on existing selection to drag it
@@ -1373,7 +1936,7 @@ class DrawingCanvas(Gtk.DrawingArea):
                     self.is_dragging_selection = True
                     self.drag_start_x = tx
                     self.drag_start_y = ty
-                    logger.debug(f"Started dragging selection from ({tx:.2f}, {ty:.2f})")
+                    logger.debug("Started dragging selection from (%.2f, %.2f)", tx, ty)
                     return
             
             # Start new selection box (don't clear selection yet - wait until drag completes)
@@ -1382,9 +1945,10 @@ class DrawingCanvas(Gtk.DrawingArea):
             self.selection_box_start_y = ty
             self.selection_box_end_x = tx
             self.selection_box_end_y = ty
-            logger.debug(f"Started selection at ({tx:.2f}, {ty:.2f})")
+            logger.debug("Started selection at (%.2f, %.2f)", tx, ty)
         elif self.shape_mode and self.current_shape_type:
             # Start shape drawing
+            self._preview_base = None
             self.shape_start_x = tx
             self.shape_start_y = ty
             self.shape_preview = Shape(
@@ -1398,7 +1962,7 @@ class DrawingCanvas(Gtk.DrawingArea):
                 filled=self.shape_filled,
                 line_style=self.shape_line_style
             )
-            logger.debug(f"Started shape at ({tx:.2f}, {ty:.2f})")
+            logger.debug("Started shape at (%.2f, %.2f)", tx, ty)
         else:
             # Check if using eraser
             if self.current_pen_type == PenType.ERASER:
@@ -1412,7 +1976,7 @@ class DrawingCanvas(Gtk.DrawingArea):
                 )
                 point = Point(tx, ty, pressure)
                 self.current_stroke.add_point(point)
-                logger.debug(f"Started erasing at ({tx:.2f}, {ty:.2f})")
+                logger.debug("Started erasing at (%.2f, %.2f)", tx, ty)
             else:
                 # Start normal stroke
                 self.current_stroke = Stroke(
@@ -1424,38 +1988,36 @@ class DrawingCanvas(Gtk.DrawingArea):
                 point = Point(tx, ty, pressure)
                 self.current_stroke.add_point(point)
                 
-                logger.debug(f"Started stroke at ({tx:.2f}, {ty:.2f})")
+                logger.debug("Started stroke at (%.2f, %.2f)", tx, ty)
     
-    def continue_stroke(self, x, y, pressure, tilt_x, tilt_y):
-        """Continue drawing the current stroke, shape, or selection."""
+    def continue_stroke(self, x, y, pressure, tilt_x, tilt_y, redraw=True):
+        """Continue drawing the current stroke, shape, or selection.
+        
+        Pass redraw=False when adding a batch of samples to a stroke; the
+        caller then queues one redraw for the batch.
+        """
         if not self.is_drawing:
             return
         
         # Transform coordinates
-        tx = (x - self.pan_x) / self.zoom
-        ty = (y - self.pan_y) / self.zoom
+        inv_zoom = 1.0 / self.zoom
+        tx = (x - self.pan_x) * inv_zoom
+        ty = (y - self.pan_y) * inv_zoom
         
         # Handle A4 notes - convert to page-relative coordinates
-        from .stroke import NoteType
-        if self.document.note_type == NoteType.A4_NOTES:
-            offset_x = self.get_page_layout(self.get_width())
-            page_height = self.document.height
-            page_gap = 20  # Gap between pages
-            top_padding = 30
-            
-            # Adjust for page offset
+        document = self.document
+        if document.note_type == NoteType.A4_NOTES:
+            # Stay on the page the stroke started on; its origin cannot
+            # change mid-stroke, so use the one start_stroke computed
+            offset_x, page_origin_y = self._stroke_page_origin
             tx = tx - offset_x
-            ty_relative = ty - top_padding
-            
-            # Calculate which page (stay on current page during stroke)
-            page_num = self.document.current_page
-            
-            # Convert to page-relative coordinates
-            ty = ty_relative - (page_num - 1) * (page_height + page_gap)
+            ty = ty - page_origin_y
             
             # Clip to page boundaries
-            tx = max(0, min(self.document.width, tx))
-            ty = max(0, min(page_height, ty))
+            page_width = document.width
+            page_height = document.height
+            tx = 0 if tx < 0 else (page_width if tx > page_width else tx)
+            ty = 0 if ty < 0 else (page_height if ty > page_height else ty)
         
         if self.selection_mode:
             if self.is_dragging_selection:
@@ -1465,36 +2027,48 @@ class DrawingCanvas(Gtk.DrawingArea):
                 self.selection.translate(dx, dy)
                 self.drag_start_x = tx
                 self.drag_start_y = ty
+                self.invalidate_page_cache()
                 self.queue_draw()
             elif self.is_selecting:
-                # Update selection box
-                self.selection_box_end_x = tx
-                self.selection_box_end_y = ty
-                self.queue_draw()
+                # Update selection box, redrawing only if its corner moved
+                if tx != self.selection_box_end_x or ty != self.selection_box_end_y:
+                    self.selection_box_end_x = tx
+                    self.selection_box_end_y = ty
+                    self.queue_draw()
         elif self.shape_mode and self.shape_preview:
-            # Update shape preview
-            self.shape_preview.end_x = tx
-            self.shape_preview.end_y = ty
-            self.queue_draw()
+            # Update shape preview, redrawing only if its end point moved
+            shape = self.shape_preview
+            if tx != shape.end_x or ty != shape.end_y:
+                shape.end_x = tx
+                shape.end_y = ty
+                self.queue_draw()
         elif self.current_stroke:
+            stroke = self.current_stroke
+            
             # Add point if moved enough (smoothing)
             dx = tx - self.last_x
             dy = ty - self.last_y
-            distance = (dx * dx + dy * dy) ** 0.5
             
-            if distance > 1.0:  # Minimum distance threshold
-                point = Point(tx, ty, pressure, tilt_x, tilt_y)
-                self.current_stroke.add_point(point)
-                
-                # If erasing, erase at this point too
-                if self.current_pen_type == PenType.ERASER:
-                    self.erase_at_point(tx, ty, self.current_width)
+            if dx * dx + dy * dy > 1.0:  # Minimum distance threshold (1px, squared)
+                if stroke.pen_type == PenType.ERASER:
+                    # The eraser path is never drawn or saved, so reuse its
+                    # one point rather than allocating a Point per sample
+                    point = stroke.points[-1]
+                    point.x = tx
+                    point.y = ty
+                    
+                    # Erase here with the other samples of this frame
+                    self.queue_erase(tx, ty)
+                else:
+                    point = Point(tx, ty, pressure, tilt_x, tilt_y)
+                    stroke.add_point(point)
+                    
+                    # Redraw to show the stroke in real-time
+                    if redraw:
+                        self.queue_draw()
                 
                 self.last_x = tx
                 self.last_y = ty
-            
-            # Always queue redraw to show stroke in real-time
-            self.queue_draw()
     
     def end_stroke(self):
         """End the current stroke, shape, or selection."""
@@ -1522,18 +2096,24 @@ class DrawingCanvas(Gtk.DrawingArea):
             self.document.add_shape(self.shape_preview)
             self.undo_stack.append(('shape', self.shape_preview))
             self.redo_stack.clear()
-            logger.info(f"Completed {self.shape_preview.shape_type.value} shape")
+            self.invalidate_page_cache()
+            logger.info("Completed %s shape", self.shape_preview.shape_type.value)
             self.shape_preview = None
+            self._preview_base = None
         elif self.current_stroke and len(self.current_stroke.points) > 0:
+            # Erase any samples still waiting for the next frame
+            self.flush_pending_erase()
+            
             # Don't save eraser strokes - they're just for tracking the eraser path
             if self.current_pen_type != PenType.ERASER:
                 # Add stroke to document
                 self.document.add_stroke(self.current_stroke)
                 self.undo_stack.append(('stroke', self.current_stroke))
                 self.redo_stack.clear()
-                logger.info(f"Completed stroke with {len(self.current_stroke.points)} points")
+                self.invalidate_page_cache()
+                logger.info("Completed stroke with %d points", len(self.current_stroke.points))
             else:
-                logger.info(f"Completed erasing")
+                logger.info("Completed erasing")
             
             self.current_stroke = None
         
@@ -1549,78 +2129,72 @@ class DrawingCanvas(Gtk.DrawingArea):
             y: Y coordinate to erase at
             eraser_size: Radius of the eraser
         """
+        self.erase_at_points([(x, y)], eraser_size)
+    
+    def erase_at_points(self, points, eraser_size):
+        """Erase everything under the eraser at any of the given points.
+        
+        Erasing a batch of samples in one pass tests each stroke once
+        against all of them and redraws once, instead of once per sample.
+        
+        Args:
+            points: List of (x, y) eraser positions
+            eraser_size: Radius of the eraser
+        """
         eraser_radius = eraser_size * 2  # Make eraser effective area larger
         
-        current_strokes = self.document.get_current_strokes()
-        current_shapes = self.document.get_current_shapes()
-        current_text_boxes = self.document.get_current_text_boxes()
+        current_strokes, current_shapes, current_text_boxes = self.document.get_current_items()
         
         # Check strokes for intersection with eraser
         strokes_to_remove = []
         strokes_to_add = []
+        radius_sq = eraser_radius * eraser_radius
+        
+        # Broad phase: only strokes whose cached bounds reach the square
+        # around the eraser path can have points under it
+        left = min(px for px, _ in points) - eraser_radius
+        top = min(py for _, py in points) - eraser_radius
+        right = max(px for px, _ in points) + eraser_radius
+        bottom = max(py for _, py in points) + eraser_radius
+        single = points[0] if len(points) == 1 else None
+        candidates = []
+        for stroke in current_strokes:
+            min_x, min_y, max_x, max_y = stroke.get_bounds()
+            if min_x <= right and max_x >= left and min_y <= bottom and max_y >= top:
+                # For a single sample the circle itself is a tighter test
+                if single is None or _circle_hits_rect(single[0], single[1], radius_sq,
+                                                       min_x, min_y, max_x, max_y):
+                    candidates.append(stroke)
         
         if self.eraser_mode == 'pixel':
             # Pixel eraser mode: split strokes at erase point
-            for stroke in current_strokes:
-                # Find all points within eraser radius
-                erase_indices = []
-                for i, point in enumerate(stroke.points):
-                    dx = point.x - x
-                    dy = point.y - y
-                    distance = (dx * dx + dy * dy) ** 0.5
-                    if distance <= eraser_radius:
-                        erase_indices.append(i)
+            for stroke in candidates:
+                # Find the runs of points outside the eraser
+                xs, ys, _, _, _ = stroke.get_columns()
+                runs = _erase_runs(xs, ys, points, radius_sq)
                 
-                if erase_indices:
+                if runs is not None:
                     # Split stroke at erase points
                     strokes_to_remove.append(stroke)
                     
-                    # Create segments between erased points
-                    segments = []
-                    last_end = 0
-                    
-                    for erase_idx in erase_indices:
-                        # Add segment before this erase point
-                        if erase_idx > last_end:
-                            segment_points = stroke.points[last_end:erase_idx]
-                            if len(segment_points) >= 2:  # Only keep segments with 2+ points
-                                segments.append(segment_points)
-                        last_end = erase_idx + 1
-                    
-                    # Add final segment after last erase point
-                    if last_end < len(stroke.points):
-                        segment_points = stroke.points[last_end:]
-                        if len(segment_points) >= 2:
-                            segments.append(segment_points)
-                    
-                    # Create new strokes from segments
-                    for segment_points in segments:
-                        new_stroke = Stroke(
-                            points=segment_points,
-                            pen_type=stroke.pen_type,
-                            color=stroke.color,
-                            width=stroke.width
-                        )
-                        strokes_to_add.append(new_stroke)
+                    # Create new strokes from the surviving segments
+                    for start, end in runs:
+                        strokes_to_add.append(stroke.slice(start, end))
         else:
             # Stroke eraser mode: remove entire stroke
-            for stroke in current_strokes:
+            for stroke in candidates:
                 # Check if any point in the stroke is within eraser radius
-                for point in stroke.points:
-                    dx = point.x - x
-                    dy = point.y - y
-                    distance = (dx * dx + dy * dy) ** 0.5
-                    if distance <= eraser_radius:
+                xs, ys, _, _, _ = stroke.get_columns()
+                for x, y in points:
+                    if _any_point_within(xs, ys, x, y, radius_sq):
                         strokes_to_remove.append(stroke)
-                        break  # No need to check other points
-        
-        # Remove erased strokes and add split segments
-        for stroke in strokes_to_remove:
-            if stroke in current_strokes:
-                current_strokes.remove(stroke)
+                        break
         
-        for new_stroke in strokes_to_add:
-            current_strokes.append(new_stroke)
+        # Remove erased strokes and add split segments. Every hit was taken
+        # from these lists, so there is no need to check membership first.
+        if strokes_to_remove:
+            _drop_items(current_strokes, strokes_to_remove)
+        current_strokes.extend(strokes_to_add)
                 
         # Note: We don't add to undo stack during continuous erasing
         # to avoid creating too many undo steps
@@ -1629,40 +2203,65 @@ class DrawingCanvas(Gtk.DrawingArea):
         shapes_to_remove = []
         for shape in current_shapes:
             min_x, min_y, max_x, max_y = shape.get_bounds()
-            # Check if eraser point is within or near shape bounds
-            if (min_x - eraser_radius <= x <= max_x + eraser_radius and
-                min_y - eraser_radius <= y <= max_y + eraser_radius):
-                shapes_to_remove.append(shape)
+            # Check if the eraser circle touches the shape bounds
+            for x, y in points:
+                if _circle_hits_rect(x, y, radius_sq, min_x, min_y, max_x, max_y):
+                    shapes_to_remove.append(shape)
+                    break
         
         # Remove shapes
-        for shape in shapes_to_remove:
-            if shape in current_shapes:
-                current_shapes.remove(shape)
+        if shapes_to_remove:
+            _drop_items(current_shapes, shapes_to_remove)
         
         # Check text boxes for intersection
         text_boxes_to_remove = []
         for text_box in current_text_boxes:
             min_x, min_y, max_x, max_y = text_box.get_bounds()
-            # Check if eraser point is within or near text box bounds
-            if (min_x - eraser_radius <= x <= max_x + eraser_radius and
-                min_y - eraser_radius <= y <= max_y + eraser_radius):
-                text_boxes_to_remove.append(text_box)
+            # Check if the eraser circle touches the text box bounds
+            for x, y in points:
+                if _circle_hits_rect(x, y, radius_sq, min_x, min_y, max_x, max_y):
+                    text_boxes_to_remove.append(text_box)
+                    break
         
         # Remove text boxes
-        for text_box in text_boxes_to_remove:
-            if text_box in current_text_boxes:
-                current_text_boxes.remove(text_box)
+        if text_boxes_to_remove:
+            _drop_items(current_text_boxes, text_boxes_to_remove)
         
         # Redraw if anything was erased
         if strokes_to_remove or shapes_to_remove or text_boxes_to_remove:
+            self.invalidate_page_cache()
             self.queue_draw()
     
+    def queue_erase(self, x, y):
+        """Queue an eraser sample to be erased with the others of this frame."""
+        self._pending_erase.append((x, y))
+        if not self._erase_tick_id:
+            self._erase_tick_id = self.add_tick_callback(self._on_erase_tick)
+    
+    def _on_erase_tick(self, widget, frame_clock):
+        """Erase the samples queued since the last frame."""
+        self._erase_tick_id = 0
+        self.flush_pending_erase()
+        return GLib.SOURCE_REMOVE
+    
+    def flush_pending_erase(self):
+        """Erase all queued eraser samples now."""
+        if self._erase_tick_id:
+            self.remove_tick_callback(self._erase_tick_id)
+            self._erase_tick_id = 0
+        if self._pending_erase:
+            points = self._pending_erase
+            self._pending_erase = []
+            self.erase_at_points(points, self.current_width)
+    
     def complete_selection(self):
         """Find and select all objects within the selection box."""
-        min_x = min(self.selection_box_start_x, self.selection_box_end_x)
-        max_x = max(self.selection_box_start_x, self.selection_box_end_x)
-        min_y = min(self.selection_box_start_y, self.selection_box_end_y)
-        max_y = max(self.selection_box_start_y, self.selection_box_end_y)
+        min_x, max_x = self.selection_box_start_x, self.selection_box_end_x
+        if max_x < min_x:
+            min_x, max_x = max_x, min_x
+        min_y, max_y = self.selection_box_start_y, self.selection_box_end_y
+        if max_y < min_y:
+            min_y, max_y = max_y, min_y
         
         # Calculate selection box size
         width = max_x - min_x
@@ -1673,63 +2272,44 @@ class DrawingCanvas(Gtk.DrawingArea):
             logger.debug(f"Selection box too small ({width:.1f}x{height:.1f}), ignoring")
             return
         
-        # Clear previous selection before selecting new items
-        self.selection.clear()
+        current_strokes, current_shapes, current_text_boxes = self.document.get_current_items()
         
-        # Check strokes
-        current_strokes = self.document.get_current_strokes()
-        for stroke in current_strokes:
-            stroke_min_x, stroke_min_y, stroke_max_x, stroke_max_y = stroke.get_bounds()
-            # Check if stroke is within or overlaps selection box
-            if (stroke_min_x <= max_x and stroke_max_x >= min_x and
-                stroke_min_y <= max_y and stroke_max_y >= min_y):
-                self.selection.add_stroke(stroke)
-        
-        # Check shapes
-        current_shapes = self.document.get_current_shapes()
-        for shape in current_shapes:
-            shape_min_x, shape_min_y, shape_max_x, shape_max_y = shape.get_bounds()
-            # Check if shape is within or overlaps selection box
-            if (shape_min_x <= max_x and shape_max_x >= min_x and
-                shape_min_y <= max_y and shape_max_y >= min_y):
-                self.selection.add_shape(shape)
-        
-        # Check text boxes
-        current_text_boxes = self.document.get_current_text_boxes()
-        for text_box in current_text_boxes:
-            text_min_x, text_min_y, text_max_x, text_max_y = text_box.get_bounds()
-            # Check if text box is within or overlaps selection box
-            if (text_min_x <= max_x and text_max_x >= min_x and
-                text_min_y <= max_y and text_max_y >= min_y):
-                self.selection.add_text_box(text_box)
+        # Keep every stroke, shape and text box whose bounds (cached for
+        # strokes) are within or overlap the selection box
+        strokes = _items_overlapping(current_strokes, min_x, min_y, max_x, max_y)
+        shapes = _items_overlapping(current_shapes, min_x, min_y, max_x, max_y)
+        text_boxes = _items_overlapping(current_text_boxes, min_x, min_y, max_x, max_y)
+        
+        # Replace the previous selection in one go, so its bounds are
+        # computed once rather than after every added object
+        self.selection.set_items(strokes, shapes, text_boxes)
         
         logger.info(f"Selected {len(self.selection.strokes)} strokes, {len(self.selection.shapes)} shapes, and {len(self.selection.text_boxes)} text boxes")
     
     def undo(self):
-        """Undo the last stroke, shape, or text box."""
+        """Undo the last stroke, shape, text box, paste or deletion."""
         if len(self.undo_stack) > 0:
             item = self.undo_stack.pop()
             item_type, obj = item
             
             if item_type == 'stroke':
-                current_strokes = self.document.get_current_strokes()
-                if obj in current_strokes:
-                    current_strokes.remove(obj)
+                _remove_items(self.document.get_current_strokes(), (obj,))
             elif item_type == 'shape':
-                current_shapes = self.document.get_current_shapes()
-                if obj in current_shapes:
-                    current_shapes.remove(obj)
+                _remove_items(self.document.get_current_shapes(), (obj,))
             elif item_type == 'text_box':
-                current_text_boxes = self.document.get_current_text_boxes()
-                if obj in current_text_boxes:
-                    current_text_boxes.remove(obj)
+                _remove_items(self.document.get_current_text_boxes(), (obj,))
+            elif item_type == 'paste':
+                self.remove_item_group(obj)
+            elif item_type == 'delete':
+                self.document.add_items(*obj)
             
             self.redo_stack.append(item)
+            self.invalidate_page_cache()
             self.queue_draw()
             logger.info(f"Undo last {item_type}")
     
     def redo(self):
-        """Redo the last undone stroke, shape, or text box."""
+        """Redo the last undone stroke, shape, text box, paste or deletion."""
         if len(self.redo_stack) > 0:
             item = self.redo_stack.pop()
             item_type, obj = item
@@ -1740,16 +2320,34 @@ class DrawingCanvas(Gtk.DrawingArea):
                 self.document.add_shape(obj)
             elif item_type == 'text_box':
                 self.document.add_text_box(obj)
+            elif item_type == 'paste':
+                self.document.add_items(*obj)
+            elif item_type == 'delete':
+                self.remove_item_group(obj)
             
             self.undo_stack.append(item)
+            self.invalidate_page_cache()
             self.queue_draw()
             logger.info(f"Redo {item_type}")
     
+    def remove_item_group(self, group):
+        """Remove a (strokes, shapes, text_boxes) group from the current page.
+        
+        Returns:
+            The group's objects that were present, as a new group
+        """
+        current_strokes, current_shapes, current_text_boxes = self.document.get_current_items()
+        strokes, shapes, text_boxes = group
+        return (_remove_items(current_strokes, strokes),
+                _remove_items(current_shapes, shapes),
+                _remove_items(current_text_boxes, text_boxes))
+    
     def clear_canvas(self):
         """Clear all strokes."""
         self.document.clear()
         self.undo_stack.clear()
         self.redo_stack.clear()
+        self.invalidate_page_cache(all_pages=True)
         self.queue_draw()
         logger.info("Canvas cleared")
     
@@ -1774,22 +2372,8 @@ class DrawingCanvas(Gtk.DrawingArea):
         if not self.selection_mode:
             self.enable_selection_mode()
         
-        self.selection.clear()
-        
-        # Select all strokes
-        current_strokes = self.document.get_current_strokes()
-        for stroke in current_strokes:
-            self.selection.add_stroke(stroke)
-        
-        # Select all shapes
-        current_shapes = self.document.get_current_shapes()
-        for shape in current_shapes:
-            self.selection.add_shape(shape)
-        
-        # Select all text boxes
-        current_text_boxes = self.document.get_current_text_boxes()
-        for text_box in current_text_boxes:
-            self.selection.add_text_box(text_box)
+        # Select all strokes, shapes and text boxes
+        self.selection.set_items(*self.document.get_current_items())
         
         self.queue_draw()
         logger.info(f"Selected all: {len(self.selection.strokes)} strokes, {len(self.selection.shapes)} shapes, and {len(self.selection.text_boxes)} text boxes")
@@ -1813,24 +2397,18 @@ class DrawingCanvas(Gtk.DrawingArea):
         pasted = self.clipboard.copy()
         pasted.translate(20, 20)  # Offset by 20 pixels
         
-        # Add to document
-        for stroke in pasted.strokes:
-            self.document.add_stroke(stroke)
-            self.undo_stack.append(('stroke', stroke))
-        
-        for shape in pasted.shapes:
-            self.document.add_shape(shape)
-            self.undo_stack.append(('shape', shape))
-        
-        for text_box in pasted.text_boxes:
-            self.document.add_text_box(text_box)
-            self.undo_stack.append(('text_box', text_box))
+        # Add to document in one batch
+        self.document.add_items(pasted.strokes, pasted.shapes, pasted.text_boxes)
+        # One undo step for the whole paste, so a large paste can't push
+        # older steps out of the bounded history
+        self.undo_stack.append(('paste', (list(pasted.strokes), list(pasted.shapes), list(pasted.text_boxes))))
         
         self.redo_stack.clear()
         
         # Select the pasted items
         self.selection = pasted
         
+        self.invalidate_page_cache()
         self.queue_draw()
         logger.info(f"Pasted {len(pasted.strokes)} strokes, {len(pasted.shapes)} shapes, and {len(pasted.text_boxes)} text boxes")
     
@@ -1840,27 +2418,10 @@ class DrawingCanvas(Gtk.DrawingArea):
             logger.warning("Nothing selected to delete")
             return
         
-        current_strokes = self.document.get_current_strokes()
-        current_shapes = self.document.get_current_shapes()
-        current_text_boxes = self.document.get_current_text_boxes()
-        
-        # Remove selected strokes
-        for stroke in self.selection.strokes:
-            if stroke in current_strokes:
-                current_strokes.remove(stroke)
-                self.undo_stack.append(('delete_stroke', stroke))
-        
-        # Remove selected shapes
-        for shape in self.selection.shapes:
-            if shape in current_shapes:
-                current_shapes.remove(shape)
-                self.undo_stack.append(('delete_shape', shape))
-        
-        # Remove selected text boxes
-        for text_box in self.selection.text_boxes:
-            if text_box in current_text_boxes:
-                current_text_boxes.remove(text_box)
-                self.undo_stack.append(('delete_text_box', text_box))
+        # Remove the selected items as one undo step, so a large deletion
+        # can't push older steps out of the bounded history
+        removed = self.remove_item_group((self.selection.strokes, self.selection.shapes, self.selection.text_boxes))
+        self.undo_stack.append(('delete', removed))
         
         self.redo_stack.clear()
         
@@ -1869,6 +2430,7 @@ class DrawingCanvas(Gtk.DrawingArea):
         count_text_boxes = len(self.selection.text_boxes)
         self.selection.clear()
         
+        self.invalidate_page_cache()
         self.queue_draw()
         logger.info(f"Deleted {count_strokes} strokes, {count_shapes} shapes, and {count_text_boxes} text boxes")
     
@@ -1962,7 +2524,6 @@ class DrawingCanvas(Gtk.DrawingArea):
     
     def calculate_fit_zoom(self):
         """Calculate zoom level to fit page width to screen (80% of screen width)."""
-        from .stroke import NoteType
         if self.document.note_type == NoteType.A4_NOTES:
             canvas_width = self.get_width()
             if canvas_width > 0:
@@ -1975,93 +2536,36 @@ class DrawingCanvas(Gtk.DrawingArea):
     
     def zoom_in(self, center_x=None, center_y=None):
         """Zoom in by 20% (1.2x multiplier)."""
-        from .stroke import NoteType
-        
-        # For A4 notes, maintain page centering
-        if self.document.note_type == NoteType.A4_NOTES:
-            # Get canvas dimensions
-            canvas_width = self.get_width()
-            canvas_height = self.get_height()
-            
-            if canvas_width <= 0:
-                canvas_width = 800
-            if canvas_height <= 0:
-                canvas_height = 600
-            
-            # Calculate current page center in canvas coordinates
-            page_width = self.document.width
-            offset_x = self.get_page_layout(canvas_width)
-            page_center_x = offset_x + page_width / 2
-            
-            # Use document center as zoom focus
-            doc_x = page_center_x
-            doc_y = self.document.height / 2
-            
-            # Map to canvas coordinates
-            center_x = doc_x * self.zoom + self.pan_x
-            center_y = doc_y * self.zoom + self.pan_y
-        else:
-            if center_x is None:
-                center_x = self.get_width() / 2
-            if center_y is None:
-                center_y = self.get_height() / 2
-            
-            # Convert to document coordinates before zoom
-            doc_x = (center_x - self.pan_x) / self.zoom
-            doc_y = (center_y - self.pan_y) / self.zoom
-        
-        # Calculate new zoom (increase by 20%)
-        new_zoom = self.zoom * 1.2
-        new_zoom = max(0.1, min(10.0, new_zoom))
-        
-        # Update zoom
-        old_zoom = self.zoom
-        self.zoom = new_zoom
-        
-        # Adjust pan to keep center point stationary
-        if self.document.note_type == NoteType.A4_NOTES:
-            # Recalculate page position with new zoom
-            canvas_width = self.get_width() if self.get_width() > 0 else 800
-            offset_x = self.get_page_layout(canvas_width)
-            page_center_x = offset_x + self.document.width / 2
-            
-            # Keep page horizontally centered
-            self.pan_x = center_x - page_center_x * self.zoom
-            self.pan_y = center_y - doc_y * self.zoom
-        else:
-            self.pan_x = center_x - doc_x * self.zoom
-            self.pan_y = center_y - doc_y * self.zoom
-        
-        self.queue_draw()
-        logger.info(f"Zoom in: {old_zoom:.2f}x → {self.zoom:.2f}x")
+        self._apply_zoom(1.2, center_x, center_y, "Zoom in")
     
     def zoom_out(self, center_x=None, center_y=None):
         """Zoom out by 20% (0.833x multiplier)."""
-        from .stroke import NoteType
+        self._apply_zoom(1 / 1.2, center_x, center_y, "Zoom out")
+    
+    def _apply_zoom(self, factor, center_x, center_y, label):
+        """Scale the zoom by factor, keeping the focus point stationary.
+        
+        A4 notes zoom around the page center and stay horizontally centered;
+        the canvas zooms around (center_x, center_y), defaulting to the
+        middle of the widget.
+        """
+        old_zoom = self.zoom
         
         # For A4 notes, maintain page centering
-        if self.document.note_type == NoteType.A4_NOTES:
-            # Get canvas dimensions
+        is_a4 = self.document.note_type == NoteType.A4_NOTES
+        if is_a4:
             canvas_width = self.get_width()
-            canvas_height = self.get_height()
-            
             if canvas_width <= 0:
                 canvas_width = 800
-            if canvas_height <= 0:
-                canvas_height = 600
-            
-            # Calculate current page center in canvas coordinates
-            page_width = self.document.width
-            offset_x = self.get_page_layout(canvas_width)
-            page_center_x = offset_x + page_width / 2
+            half_page_width = self.document.width / 2
             
             # Use document center as zoom focus
-            doc_x = page_center_x
             doc_y = self.document.height / 2
+            page_center_x = self.get_page_layout(canvas_width) + half_page_width
             
             # Map to canvas coordinates
-            center_x = doc_x * self.zoom + self.pan_x
-            center_y = doc_y * self.zoom + self.pan_y
+            center_x = page_center_x * old_zoom + self.pan_x
+            center_y = doc_y * old_zoom + self.pan_y
         else:
             if center_x is None:
                 center_x = self.get_width() / 2
@@ -2069,37 +2573,28 @@ class DrawingCanvas(Gtk.DrawingArea):
                 center_y = self.get_height() / 2
             
             # Convert to document coordinates before zoom
-            doc_x = (center_x - self.pan_x) / self.zoom
-            doc_y = (center_y - self.pan_y) / self.zoom
+            doc_x = (center_x - self.pan_x) / old_zoom
+            doc_y = (center_y - self.pan_y) / old_zoom
         
-        # Calculate new zoom (decrease by 20%)
-        new_zoom = self.zoom / 1.2
-        new_zoom = max(0.1, min(10.0, new_zoom))
-        
-        # Update zoom
-        old_zoom = self.zoom
-        self.zoom = new_zoom
+        # Calculate and clamp the new zoom
+        new_zoom = old_zoom * factor
+        self.zoom = 0.1 if new_zoom < 0.1 else (10.0 if new_zoom > 10.0 else new_zoom)
         
         # Adjust pan to keep center point stationary
-        if self.document.note_type == NoteType.A4_NOTES:
-            # Recalculate page position with new zoom
-            canvas_width = self.get_width() if self.get_width() > 0 else 800
-            offset_x = self.get_page_layout(canvas_width)
-            page_center_x = offset_x + self.document.width / 2
-            
-            # Keep page horizontally centered
+        if is_a4:
+            # Recalculate page position with new zoom and keep the page
+            # horizontally centered
+            page_center_x = self.get_page_layout(canvas_width) + half_page_width
             self.pan_x = center_x - page_center_x * self.zoom
-            self.pan_y = center_y - doc_y * self.zoom
         else:
             self.pan_x = center_x - doc_x * self.zoom
-            self.pan_y = center_y - doc_y * self.zoom
+        self.pan_y = center_y - doc_y * self.zoom
         
         self.queue_draw()
-        logger.info(f"Zoom out: {old_zoom:.2f}x → {self.zoom:.2f}x")
+        logger.info("%s: %.2fx → %.2fx", label, old_zoom, self.zoom)
     
     def reset_view(self):
         """Reset zoom and pan to fit page to screen."""
-        from .stroke import NoteType
         if self.document.note_type == NoteType.A4_NOTES:
             # Auto-fit zoom for A4 pages
             self.zoom = self.calculate_fit_zoom()
@@ -2126,7 +2621,6 @@ class DrawingCanvas(Gtk.DrawingArea):
         Returns:
             Page number (1-indexed) of the page that's most visible
         """
-        from .stroke import NoteType
         if self.document.note_type != NoteType.A4_NOTES:
             return None
         
@@ -2152,7 +2646,6 @@ class DrawingCanvas(Gtk.DrawingArea):
     
     def next_page(self):
         """Go to next page (for A4 notes)."""
-        from .stroke import NoteType
         if self.document.note_type == NoteType.A4_NOTES:
             self.document.next_page()
             self.queue_draw()
@@ -2163,7 +2656,6 @@ class DrawingCanvas(Gtk.DrawingArea):
     
     def prev_page(self):
         """Go to previous page (for A4 notes)."""
-        from .stroke import NoteType
         if self.document.note_type == NoteType.A4_NOTES:
             self.document.prev_page()
             self.queue_draw()
@@ -2178,7 +2670,6 @@ class DrawingCanvas(Gtk.DrawingArea):
         Args:
             scroll_y: Current vertical scroll position
         """
-        from .stroke import NoteType
         if self.document.note_type != NoteType.A4_NOTES:
             return
         
@@ -2203,6 +2694,7 @@ class DrawingCanvas(Gtk.DrawingArea):
                 self.document.add_text_box(self.current_text_box)
                 self.undo_stack.append(('text_box', self.current_text_box))
                 self.redo_stack.clear()
+                self.invalidate_page_cache()
             self.current_text_box = None
         
         self.update_cursor()
@@ -2236,23 +2728,22 @@ class DrawingCanvas(Gtk.DrawingArea):
         """Draw a text box on the canvas."""
         from gi.repository import Pango, PangoCairo
         
-        # Create Pango layout
-        layout = PangoCairo.create_layout(cr)
-        layout.set_text(text_box.text if text_box.text else " ", -1)
-        layout.set_width(int(text_box.width * Pango.SCALE))
-        layout.set_wrap(Pango.WrapMode.WORD_CHAR)
-        
-        # Set font description
-        font_desc = Pango.FontDescription()
-        font_desc.set_family(text_box.font_family)
-        font_desc.set_size(int(text_box.font_size * Pango.SCALE))
-        
-        if text_box.bold:
-            font_desc.set_weight(Pango.Weight.BOLD)
-        if text_box.italic:
-            font_desc.set_style(Pango.Style.ITALIC)
-        
-        layout.set_font_description(font_desc)
+        # Reuse the text box's layout until its text, width or font changes,
+        # so redraws (and the cursor) do not re-shape unchanged text
+        key = (text_box.text, text_box.width, text_box.font_family,
+               text_box.font_size, text_box.bold, text_box.italic)
+        cached = text_box._layout
+        if cached is not None and cached[0] == key:
+            layout = cached[1]
+            PangoCairo.update_layout(cr, layout)
+        else:
+            # Create Pango layout
+            layout = PangoCairo.create_layout(cr)
+            layout.set_text(text_box.text if text_box.text else " ", -1)
+            layout.set_width(int(text_box.width * Pango.SCALE))
+            layout.set_wrap(Pango.WrapMode.WORD_CHAR)
+            layout.set_font_description(self.get_font_description(text_box))
+            text_box._layout = (key, layout)
         
         # Draw text
         cr.save()
@@ -2260,9 +2751,12 @@ class DrawingCanvas(Gtk.DrawingArea):
         cr.set_source_rgba(*text_box.color)
         PangoCairo.show_layout(cr, layout)
         
+        # The underline and the editing border share the text extents
+        if text_box.underline and text_box.text or show_cursor:
+            ink_rect, logical_rect = layout.get_pixel_extents()
+        
         # Draw underline if needed
         if text_box.underline and text_box.text:
-            ink_rect, logical_rect = layout.get_pixel_extents()
             cr.set_line_width(1)
             y_underline = text_box.y + logical_rect.height
             cr.move_to(text_box.x, y_underline)
@@ -2287,9 +2781,7 @@ class DrawingCanvas(Gtk.DrawingArea):
             cr.line_to(cursor_x, cursor_y + cursor_height)
             cr.stroke()
             
-            # Draw text box border when editing
-            ink_rect, logical_rect = layout.get_pixel_extents()
-            # Add padding around the text
+            # Draw text box border when editing, with padding around the text
             padding = 5
             cr.set_source_rgba(0.5, 0.5, 1.0, 0.3)
             cr.set_line_width(1)
@@ -2305,6 +2797,29 @@ class DrawingCanvas(Gtk.DrawingArea):
         
         cr.restore()
     
+    def get_font_description(self, text_box: TextBox):
+        """Get the Pango font description for a text box's font settings.
+        
+        Descriptions are shared by every text box with the same family,
+        size and style, so redraws do not rebuild them.
+        """
+        key = (text_box.font_family, text_box.font_size, text_box.bold, text_box.italic)
+        font_desc = self._font_descriptions.get(key)
+        if font_desc is None:
+            from gi.repository import Pango
+            
+            font_desc = Pango.FontDescription()
+            font_desc.set_family(text_box.font_family)
+            font_desc.set_size(int(text_box.font_size * Pango.SCALE))
+            
+            if text_box.bold:
+                font_desc.set_weight(Pango.Weight.BOLD)
+            if text_box.italic:
+                font_desc.set_style(Pango.Style.ITALIC)
+            
+            self._font_descriptions[key] = font_desc
+        return font_desc
+    
     def handle_text_key_press(self, keyval, keycode, state):
         """Handle keyboard input for text editing."""
         if not self.text_mode or not self.current_text_box:
@@ -1,22 +1,30 @@
 """Input handling with palm rejection using evdev."""
 import logging
-import threading
 import time
 from pathlib import Path
 from typing import Optional, Callable
 import gi
 gi.require_version('Gtk', '4.0')
-from gi.repository import GLib
+from gi.repository import GLib, Gio
 
 try:
     from evdev import InputDevice, categorize, ecodes, list_devices
     EVDEV_AVAILABLE = True
+    # Keys held while a stylus is in proximity or touching
+    _STYLUS_PROXIMITY_CODES = frozenset((ecodes.BTN_TOOL_PEN, ecodes.BTN_TOOL_RUBBER, ecodes.BTN_TOUCH))
+    # Keys that mark a device as a stylus
+    _STYLUS_BUTTON_CODES = frozenset((ecodes.BTN_TOOL_PEN, ecodes.BTN_TOOL_RUBBER,
+                                      ecodes.BTN_STYLUS, ecodes.BTN_STYLUS2))
 except ImportError:
     EVDEV_AVAILABLE = False
+    _STYLUS_PROXIMITY_CODES = _STYLUS_BUTTON_CODES = frozenset()
     logging.warning("evdev not available, palm rejection will be disabled")
 
 logger = logging.getLogger(__name__)
 
+# Directory watched for hotplugged input devices
+INPUT_DEVICE_DIR = '/dev/input'
+
 
 class InputHandler:
     """Handles input device monitoring for palm rejection."""
@@ -25,17 +33,32 @@ class InputHandler:
         self.stylus_active = False
         self.touch_enabled = True
         self.monitoring = False
-        self.monitor_thread: Optional[threading.Thread] = None
+        # GLib watch source id per stylus device path
+        self._watch_ids = {}
+        # Gio.FileMonitor on INPUT_DEVICE_DIR while monitoring
+        self._device_dir_monitor = None
         
         self.stylus_devices = []
         self.touch_devices = []
+        # Every /dev/input node already classified by detect_devices()
+        self._device_paths = set()
+        # Last value of each proximity/touch key per stylus device path
+        self._pen_keys = {}
         
         self.on_stylus_state_change: Optional[Callable[[bool], None]] = None
         
         logger.info(f"InputHandler initialized (evdev available: {EVDEV_AVAILABLE})")
     
     def start_monitoring(self):
-        """Start monitoring input devices."""
+        """Start monitoring input devices.
+        
+        Monitoring keeps watching for hotplugged devices even when none are
+        present yet.
+        
+        Returns:
+            True if stylus or touch devices were found, False if none were
+            (or monitoring could not start)
+        """
         if not EVDEV_AVAILABLE:
             logger.warning("Cannot start monitoring: evdev not available")
             return False
@@ -44,40 +67,71 @@ class InputHandler:
             logger.warning("Already monitoring")
             return False
         
-        # Detect devices
-        self.detect_devices()
+        self.monitoring = True
+        # Devices found by an earlier run are not reported by detect_devices() again
+        for device in self.stylus_devices:
+            self._watch_stylus(device)
+        self._scan_devices()
+        
+        # Rescan when device nodes appear, go away or get their permissions
+        try:
+            self._device_dir_monitor = Gio.File.new_for_path(INPUT_DEVICE_DIR).monitor_directory(
+                Gio.FileMonitorFlags.NONE, None)
+            self._device_dir_monitor.connect('changed', self._on_device_dir_changed)
+        except GLib.Error as e:
+            logger.warning(f"Cannot watch {INPUT_DEVICE_DIR} for new devices: {e.message}")
         
         if not self.stylus_devices and not self.touch_devices:
-            logger.warning("No stylus or touch devices found")
+            logger.warning("No stylus or touch devices found, waiting for one to be plugged in")
             return False
         
-        self.monitoring = True
-        self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
-        self.monitor_thread.start()
-        
         logger.info("Input monitoring started")
         return True
     
     def stop_monitoring(self):
         """Stop monitoring input devices."""
         self.monitoring = False
-        if self.monitor_thread:
-            self.monitor_thread.join(timeout=2.0)
-            self.monitor_thread = None
+        for watch_id in self._watch_ids.values():
+            GLib.source_remove(watch_id)
+        self._watch_ids.clear()
+        self._pen_keys.clear()
+        if self._device_dir_monitor is not None:
+            self._device_dir_monitor.cancel()
+            self._device_dir_monitor = None
         logger.info("Input monitoring stopped")
     
-    def detect_devices(self):
-        """Detect stylus and touch input devices."""
-        if not EVDEV_AVAILABLE:
-            return
+    def detect_devices(self) -> list:
+        """Detect stylus and touch input devices added since the last call.
+        
+        Only nodes not yet opened are opened, and devices whose nodes are
+        gone are dropped, so calling this again picks up hotplugged devices
+        cheaply. A node that cannot be opened (e.g. before udev has set its
+        permissions) is tried again on the next call.
         
-        self.stylus_devices.clear()
-        self.touch_devices.clear()
+        Returns:
+            Newly found stylus devices
+        """
+        if not EVDEV_AVAILABLE:
+            return []
         
+        new_stylus_devices = []
         try:
-            devices = [InputDevice(path) for path in list_devices()]
+            paths = set(list_devices())
+            removed = self._device_paths - paths
+            if removed:
+                for device in self.stylus_devices + self.touch_devices:
+                    if device.path in removed:
+                        self._forget_device(device)
+                self._device_paths -= removed
             
-            for device in devices:
+            for path in paths - self._device_paths:
+                try:
+                    device = InputDevice(path)
+                except Exception as e:
+                    logger.debug(f"Cannot open {path}: {e}")
+                    continue
+                self._device_paths.add(path)
+                
                 caps = device.capabilities(verbose=False)
                 name = device.name.lower()
                 
@@ -85,18 +139,10 @@ class InputHandler:
                 
                 # Check if device supports pen/stylus input
                 if ecodes.EV_KEY in caps:
-                    keys = caps[ecodes.EV_KEY]
-                    
                     # Look for stylus-specific button codes
-                    stylus_buttons = [
-                        ecodes.BTN_TOOL_PEN,
-                        ecodes.BTN_TOOL_RUBBER,
-                        ecodes.BTN_STYLUS,
-                        ecodes.BTN_STYLUS2,
-                    ]
-                    
-                    if any(btn in keys for btn in stylus_buttons):
+                    if not _STYLUS_BUTTON_CODES.isdisjoint(caps[ecodes.EV_KEY]):
                         self.stylus_devices.append(device)
+                        new_stylus_devices.append(device)
                         logger.info(f"Found stylus device: {device.name} ({device.path})")
                         continue
                 
@@ -112,65 +158,119 @@ class InputHandler:
                         if device not in self.stylus_devices:
                             self.touch_devices.append(device)
                             logger.info(f"Found touch device: {device.name} ({device.path})")
+                            continue
+                
+                # Neither stylus nor touch screen; don't keep it open
+                device.close()
         
         except Exception as e:
             logger.error(f"Error detecting devices: {e}")
+        return new_stylus_devices
     
-    def _monitor_loop(self):
-        """Main monitoring loop running in a separate thread."""
-        logger.info("Monitor loop started")
-        
-        while self.monitoring:
-            try:
-                # Monitor stylus devices for proximity
-                stylus_detected = False
-                
-                for device in self.stylus_devices:
-                    try:
-                        # Check if device has pending events
-                        if device.active_keys():
-                            stylus_detected = True
-                            break
-                        
-                        # Non-blocking read with timeout
-                        for event in device.read():
-                            if event.type == ecodes.EV_KEY:
-                                # Stylus proximity or button events
-                                if event.code in [ecodes.BTN_TOOL_PEN, 
-                                                 ecodes.BTN_TOOL_RUBBER,
-                                                 ecodes.BTN_TOUCH]:
-                                    if event.value == 1:  # Pressed/In proximity
-                                        stylus_detected = True
-                                        break
-                    
-                    except BlockingIOError:
-                        # No events available, continue
-                        pass
-                    except Exception as e:
-                        logger.debug(f"Error reading from {device.name}: {e}")
-                
-                # Update stylus state
-                if stylus_detected != self.stylus_active:
-                    self.stylus_active = stylus_detected
-                    self.touch_enabled = not stylus_detected
-                    
-                    logger.info(f"Stylus state changed: active={stylus_detected}, touch_enabled={self.touch_enabled}")
-                    
-                    # Notify callback on main thread
-                    if self.on_stylus_state_change:
-                        GLib.idle_add(self.on_stylus_state_change, stylus_detected)
-                    
-                    # Disable/enable touch devices
-                    self._set_touch_enabled(self.touch_enabled)
-                
-                # Small sleep to avoid busy-waiting
-                time.sleep(0.05)
+    def _scan_devices(self):
+        """Watch stylus devices found since the last scan."""
+        for device in self.detect_devices():
+            self._watch_stylus(device)
+    
+    def _on_device_dir_changed(self, monitor, file, other_file, event_type):
+        """Rescan when a device node is added, removed or made accessible."""
+        if not file.get_basename().startswith('event'):
+            return
+        if event_type in (Gio.FileMonitorEvent.CREATED,
+                          Gio.FileMonitorEvent.DELETED,
+                          Gio.FileMonitorEvent.ATTRIBUTE_CHANGED):
+            self._scan_devices()
+    
+    def _forget_device(self, device):
+        """Stop watching a device that went away and close it.
+        
+        Its path is forgotten too, so a device plugged in later under the
+        same node is opened again.
+        """
+        watch_id = self._watch_ids.pop(device.path, None)
+        if watch_id is not None:
+            GLib.source_remove(watch_id)
+        self._pen_keys.pop(device.path, None)
+        self._device_paths.discard(device.path)
+        if device in self.stylus_devices:
+            self.stylus_devices.remove(device)
+        if device in self.touch_devices:
+            self.touch_devices.remove(device)
+        try:
+            device.close()
+        except Exception:
+            pass
+    
+    def _on_device_readable(self, fd, condition, device):
+        """Read a stylus device's events when the main loop sees them pending."""
+        if not self._read_pen_keys(device) or condition & (GLib.IO_HUP | GLib.IO_ERR):
+            # Device went away; stop watching it (returning False removes
+            # the watch, so drop its id first)
+            del self._watch_ids[device.path]
+            self._forget_device(device)
+            self._update_stylus_state()
+            return False
+        
+        self._update_stylus_state()
+        return True
+    
+    def _update_stylus_state(self):
+        """Update stylus and touch state from the held stylus keys."""
+        # Pressed/In proximity if any device still holds a key
+        stylus_detected = any(any(keys.values()) for keys in self._pen_keys.values())
+        
+        # Update stylus state
+        if stylus_detected != self.stylus_active:
+            self.stylus_active = stylus_detected
+            self.touch_enabled = not stylus_detected
             
-            except Exception as e:
-                logger.error(f"Error in monitor loop: {e}")
-                time.sleep(0.5)
+            logger.info(f"Stylus state changed: active={stylus_detected}, touch_enabled={self.touch_enabled}")
+            
+            # Watches run on the main loop, so notify directly
+            if self.on_stylus_state_change:
+                self.on_stylus_state_change(stylus_detected)
+            
+            # Disable/enable touch devices
+            self._set_touch_enabled(self.touch_enabled)
+    
+    def _watch_stylus(self, device):
+        """Watch a stylus device's fd from the GLib main loop."""
+        try:
+            # Seed from the keys already held when the device is found
+            self._pen_keys[device.path] = {
+                code: 1 for code in device.active_keys()
+                if code in _STYLUS_PROXIMITY_CODES
+            }
+            self._watch_ids[device.path] = GLib.unix_fd_add_full(
+                GLib.PRIORITY_HIGH, device.fd, GLib.IO_IN | GLib.IO_HUP | GLib.IO_ERR,
+                self._on_device_readable, device)
+        except Exception as e:
+            self._pen_keys.pop(device.path, None)
+            logger.debug(f"Cannot watch {device.name}: {e}")
+    
+    def _read_pen_keys(self, device) -> bool:
+        """Drain a stylus device's pending events into its key state.
         
-        logger.info("Monitor loop stopped")
+        Every queued event is read, so a pen-up queued behind a pen-down in
+        the same batch is not lost; the latest value of each key wins.
+        
+        Returns:
+            False if the device could not be read
+        """
+        pen_keys = self._pen_keys[device.path]
+        try:
+            for event in device.read():
+                if event.type == ecodes.EV_KEY:
+                    # Stylus proximity or button events
+                    if event.code in _STYLUS_PROXIMITY_CODES:
+                        pen_keys[event.code] = event.value
+        except BlockingIOError:
+            # No more events available
+            pass
+        except Exception as e:
+            logger.debug(f"Error reading from {device.name}: {e}")
+            return False
+        return True
     
     def _set_touch_enabled(self, enabled: bool):
         """Enable or disable touch input devices."""
@@ -4,11 +4,35 @@ import os
 from pathlib import Path
 from typing import List, Dict, Optional
 import logging
+from gi.repository import GLib
 
 from .stroke import NoteType
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Delay (ms) before a changed library index is written, so a burst of
+# changes is saved once
+INDEX_SAVE_DELAY = 500
+
+
+def _dump_index(data: Dict) -> bytes:
+    """Serialize the library index, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
+def _load_index(raw: bytes) -> Dict:
+    """Parse a serialized library index."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class NotesLibrary:
     """Manages the library of subjects and notes."""
@@ -27,15 +51,15 @@ class NotesLibrary:
         
         self.index_file = self.library_path / "index.json"
         self.subjects: Dict[str, Dict] = {}
+        self._save_source_id = 0
         self.load_index()
     
     def load_index(self):
         """Load the library index from disk."""
         if self.index_file.exists():
             try:
-                with open(self.index_file, 'r') as f:
-                    data = json.load(f)
-                    self.subjects = data.get('subjects', {})
+                data = _load_index(self.index_file.read_bytes())
+                self.subjects = data.get('subjects', {})
                 logger.info(f"Loaded library index with {len(self.subjects)} subjects")
             except Exception as e:
                 logger.error(f"Error loading library index: {e}")
@@ -45,18 +69,49 @@ class NotesLibrary:
             self.save_index()
     
     def save_index(self):
-        """Save the library index to disk."""
+        """Save the library index to disk.
+        
+        The index is written to a temporary file and renamed over the old
+        one, so a crash mid-save leaves the previous index intact.
+        """
         try:
             data = {
                 'version': '1.0',
                 'subjects': self.subjects
             }
-            with open(self.index_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            tmp_file = self.index_file.with_name(self.index_file.name + '.tmp')
+            # Serialized once and written with raw os.write() calls, bypassing
+            # Python's buffered file layer
+            buf = memoryview(_dump_index(data))
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                while buf:
+                    buf = buf[os.write(fd, buf):]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_file, self.index_file)
             logger.info("Library index saved")
         except Exception as e:
             logger.error(f"Error saving library index: {e}")
     
+    def _mark_dirty(self):
+        """Schedule a save of the library index after INDEX_SAVE_DELAY."""
+        if not self._save_source_id:
+            self._save_source_id = GLib.timeout_add(INDEX_SAVE_DELAY, self._flush_if_dirty)
+    
+    def _flush_if_dirty(self):
+        """Write the index scheduled by _mark_dirty()."""
+        self._save_source_id = 0
+        self.save_index()
+        return False
+    
+    def flush(self):
+        """Write any pending index changes now; call before quitting."""
+        if self._save_source_id:
+            GLib.source_remove(self._save_source_id)
+            self._flush_if_dirty()
+    
     def create_subject(self, subject_name: str) -> bool:
         """Create a new subject.
         
@@ -77,7 +132,7 @@ class NotesLibrary:
             'path': str(subject_dir),
             'notes': {}
         }
-        self.save_index()
+        self._mark_dirty()
         logger.info(f"Created subject: {subject_name}")
         return True
     
@@ -100,7 +155,7 @@ class NotesLibrary:
             shutil.rmtree(subject_dir)
         
         del self.subjects[subject_name]
-        self.save_index()
+        self._mark_dirty()
         logger.info(f"Deleted subject: {subject_name}")
         return True
     
@@ -138,7 +193,7 @@ class NotesLibrary:
             'type': note_type.value,
             'created': self._get_timestamp()
         }
-        self.save_index()
+        self._mark_dirty()
         logger.info(f"Created {note_type.value} note with {page_template.value} template: {subject_name}/{note_name}")
         return str(note_path)
     
@@ -165,7 +220,7 @@ class NotesLibrary:
             os.unlink(note_path)
         
         del subject_notes[note_name]
-        self.save_index()
+        self._mark_dirty()
         logger.info(f"Deleted note: {subject_name}/{note_name}")
         return True
     
@@ -254,7 +309,7 @@ class NotesLibrary:
         self.subjects[new_name]['path'] = str(new_path)
         del self.subjects[old_name]
         
-        self.save_index()
+        self._mark_dirty()
         logger.info(f"Renamed subject: {old_name} -> {new_name}")
         return True
     
@@ -281,7 +336,7 @@ class NotesLibrary:
         subject_notes[new_name]['name'] = new_name
         del subject_notes[old_name]
         
-        self.save_index()
+        self._mark_dirty()
         logger.info(f"Renamed note: {subject_name}/{old_name} -> {new_name}")
         return True
     
@@ -337,7 +392,7 @@ class NotesLibrary:
             'type': original_note['type'],
             'created': self._get_timestamp()
         }
-        self.save_index()
+        self._mark_dirty()
         logger.info(f"Duplicated note: {subject_name}/{note_name} -> {new_name}")
         return str(new_path)
     
@@ -1,5 +1,6 @@
 """Stroke and drawing data structures."""
-from dataclasses import dataclass, field
+from array import array
+from dataclasses import dataclass, field, replace
 from typing import List, Tuple, Dict
 from enum import Enum
 import json
@@ -57,6 +58,8 @@ class TextBox:
     italic: bool = False
     underline: bool = False
     width: float = 200.0  # Default text box width
+    # (key, Pango layout) kept by the canvas between redraws
+    _layout: tuple = field(default=None, init=False, repr=False, compare=False)
     
     def get_bounds(self) -> Tuple[float, float, float, float]:
         """Get bounding box (min_x, min_y, max_x, max_y)."""
@@ -100,7 +103,7 @@ class TextBox:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Point:
     """A point in the drawing with pressure and tilt information."""
     x: float
@@ -129,38 +132,70 @@ class Point:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Stroke:
     """A stroke consisting of multiple points."""
     points: List[Point] = field(default_factory=list)
     pen_type: PenType = PenType.PEN
     color: Tuple[float, float, float, float] = (0.0, 0.0, 0.0, 1.0)  # RGBA
     width: float = 2.0
+    # Parallel per-attribute float arrays of the points, built by get_columns()
+    _columns: tuple = field(default=None, init=False, repr=False, compare=False)
+    # Bounds cached by get_bounds() with the point list and count they cover
+    _bounds: tuple = field(default=None, init=False, repr=False, compare=False)
     
     def add_point(self, point: Point):
         """Add a point to the stroke."""
         self.points.append(point)
     
+    def get_columns(self) -> Tuple[array, array, array, array, array]:
+        """Get the point data as parallel arrays (xs, ys, pressures, tilts_x, tilts_y).
+        
+        The arrays are cached and only extended with points added since the
+        last call, so drawing code can zip over plain floats instead of
+        looking up Point attributes for every segment on every redraw.
+        Each column is a packed array of doubles rather than a list of
+        float objects, which keeps the cache to 8 bytes per value.
+        """
+        columns = self._columns
+        if columns is None or columns[0] is not self.points:
+            columns = (self.points, array('d'), array('d'), array('d'), array('d'), array('d'))
+            self._columns = columns
+        
+        points, xs, ys, pressures, tilts_x, tilts_y = columns
+        for point in points[len(xs):]:
+            xs.append(point.x)
+            ys.append(point.y)
+            pressures.append(point.pressure)
+            tilts_x.append(point.tilt_x)
+            tilts_y.append(point.tilt_y)
+        return xs, ys, pressures, tilts_x, tilts_y
+    
     def get_bounds(self) -> Tuple[float, float, float, float]:
         """Get bounding box (min_x, min_y, max_x, max_y)."""
         if not self.points:
             return (0, 0, 0, 0)
         
-        xs = [p.x for p in self.points]
-        ys = [p.y for p in self.points]
+        cached = self._bounds
+        if cached is not None and cached[0] is self.points and cached[1] == len(self.points):
+            return cached[2]
+        
+        xs, ys, _, _, _ = self.get_columns()
         min_x, max_x = min(xs), max(xs)
         min_y, max_y = min(ys), max(ys)
         # Add padding for stroke width
         padding = self.width
-        return (min_x - padding, min_y - padding, max_x + padding, max_y + padding)
+        bounds = (min_x - padding, min_y - padding, max_x + padding, max_y + padding)
+        self._bounds = (self.points, len(self.points), bounds)
+        return bounds
     
     def contains_point(self, x: float, y: float, tolerance: float = 10.0) -> bool:
         """Check if point is near any part of the stroke."""
+        tolerance_sq = tolerance * tolerance
         for point in self.points:
             dx = x - point.x
             dy = y - point.y
-            dist = (dx * dx + dy * dy) ** 0.5
-            if dist <= tolerance:
+            if dx * dx + dy * dy <= tolerance_sq:
                 return True
         return False
     
@@ -169,6 +204,30 @@ class Stroke:
         for point in self.points:
             point.x += dx
             point.y += dy
+        self._columns = None
+        self._bounds = None
+    
+    def copy(self) -> 'Stroke':
+        """Create an independent copy of the stroke and its points."""
+        return Stroke(
+            points=[Point(p.x, p.y, p.pressure, p.tilt_x, p.tilt_y) for p in self.points],
+            pen_type=self.pen_type,
+            color=self.color,
+            width=self.width
+        )
+    
+    def slice(self, start: int, end: int) -> 'Stroke':
+        """Create a stroke from points[start:end], sharing the Point objects.
+        
+        The new stroke's column cache is cut from this one's, so a stroke
+        split by the eraser does not rebuild its columns point by point.
+        """
+        points = self.points[start:end]
+        stroke = Stroke(points=points, pen_type=self.pen_type, color=self.color, width=self.width)
+        columns = self._columns
+        if columns is not None and columns[0] is self.points and len(columns[1]) >= end:
+            stroke._columns = (points,) + tuple(column[start:end] for column in columns[1:])
+        return stroke
     
     def to_dict(self):
         return {
@@ -251,6 +310,19 @@ class Shape:
         )
 
 
+# Resize handle positions as fractions of the selection's width and height
+_HANDLE_OFFSETS = (
+    (0.0, 0.0),  # Top-left
+    (0.5, 0.0),  # Top-middle
+    (1.0, 0.0),  # Top-right
+    (1.0, 0.5),  # Right-middle
+    (1.0, 1.0),  # Bottom-right
+    (0.5, 1.0),  # Bottom-middle
+    (0.0, 1.0),  # Bottom-left
+    (0.0, 0.5),  # Left-middle
+)
+
+
 class Selection:
     """Represents a selection of strokes and shapes."""
     
@@ -259,6 +331,7 @@ class Selection:
         self.shapes: List[Shape] = []
         self.text_boxes: List[TextBox] = []
         self.bounds: Tuple[float, float, float, float] = (0, 0, 0, 0)  # min_x, min_y, max_x, max_y
+        self._handles = None  # (bounds, handle positions) cached by get_handles()
     
     def add_stroke(self, stroke: Stroke):
         """Add a stroke to the selection."""
@@ -278,6 +351,17 @@ class Selection:
             self.text_boxes.append(text_box)
             self._update_bounds()
     
+    def set_items(self, strokes: List[Stroke], shapes: List[Shape], text_boxes: List[TextBox]):
+        """Replace the selection with the given objects.
+        
+        Selecting many objects this way computes the bounds once, instead of
+        once per add_*() call.
+        """
+        self.strokes = list(strokes)
+        self.shapes = list(shapes)
+        self.text_boxes = list(text_boxes)
+        self._update_bounds()
+    
     def remove_stroke(self, stroke: Stroke):
         """Remove a stroke from the selection."""
         if stroke in self.strokes:
@@ -307,20 +391,13 @@ class Selection:
             self.bounds = (0, 0, 0, 0)
             return
         
-        all_bounds = []
-        for stroke in self.strokes:
-            all_bounds.append(stroke.get_bounds())
-        for shape in self.shapes:
-            all_bounds.append(shape.get_bounds())
-        for text_box in self.text_boxes:
-            all_bounds.append(text_box.get_bounds())
+        all_bounds = [stroke.get_bounds() for stroke in self.strokes]
+        all_bounds.extend(shape.get_bounds() for shape in self.shapes)
+        all_bounds.extend(text_box.get_bounds() for text_box in self.text_boxes)
         
-        if all_bounds:
-            min_x = min(b[0] for b in all_bounds)
-            min_y = min(b[1] for b in all_bounds)
-            max_x = max(b[2] for b in all_bounds)
-            max_y = max(b[3] for b in all_bounds)
-            self.bounds = (min_x, min_y, max_x, max_y)
+        # Transpose once instead of scanning the list per coordinate
+        min_xs, min_ys, max_xs, max_ys = zip(*all_bounds)
+        self.bounds = (min(min_xs), min(min_ys), max(max_xs), max(max_ys))
     
     def translate(self, dx: float, dy: float):
         """Move all selected objects."""
@@ -336,13 +413,33 @@ class Selection:
         """Get the bounding box of the selection."""
         return self.bounds
     
+    def get_handles(self) -> Tuple[Tuple[float, float], ...]:
+        """Get the resize handle positions at the corners and edge midpoints.
+        
+        The positions are cached until the bounds change, so redrawing an
+        unchanged selection does not recompute them.
+        """
+        bounds = self.bounds
+        cached = self._handles
+        if cached is not None and cached[0] is bounds:
+            return cached[1]
+        
+        min_x, min_y, max_x, max_y = bounds
+        width = max_x - min_x
+        height = max_y - min_y
+        handles = tuple((min_x + fx * width, min_y + fy * height)
+                        for fx, fy in _HANDLE_OFFSETS)
+        self._handles = (bounds, handles)
+        return handles
+    
     def copy(self) -> 'Selection':
         """Create a deep copy of the selection."""
-        import copy
+        # Shapes and text boxes only hold immutable values, so a shallow
+        # replace() is enough; strokes copy their own points
         new_selection = Selection()
-        new_selection.strokes = [copy.deepcopy(stroke) for stroke in self.strokes]
-        new_selection.shapes = [copy.deepcopy(shape) for shape in self.shapes]
-        new_selection.text_boxes = [copy.deepcopy(text_box) for text_box in self.text_boxes]
+        new_selection.strokes = [stroke.copy() for stroke in self.strokes]
+        new_selection.shapes = [replace(shape) for shape in self.shapes]
+        new_selection.text_boxes = [replace(text_box) for text_box in self.text_boxes]
         new_selection._update_bounds()
         return new_selection
 
@@ -356,6 +453,7 @@ class DrawingDocument:
         self.width = 1920
         self.height = 1080
         self.background_color = (1.0, 1.0, 1.0, 1.0)  # White
+        self._page_numbers = None  # Sorted page numbers, see get_page_numbers()
         
         # For A4_NOTES: pages dictionary, for CANVAS: single page with all strokes
         if note_type == NoteType.A4_NOTES:
@@ -402,6 +500,21 @@ class DrawingDocument:
         else:
             self.text_boxes.append(text_box)
     
+    def add_items(self, strokes: List[Stroke], shapes: List[Shape], text_boxes: List[TextBox]):
+        """Add several strokes, shapes and text boxes to the document at once."""
+        if self.note_type == NoteType.A4_NOTES:
+            page = self.current_page
+            if strokes:
+                self.pages.setdefault(page, []).extend(strokes)
+            if shapes:
+                self.page_shapes.setdefault(page, []).extend(shapes)
+            if text_boxes:
+                self.page_text_boxes.setdefault(page, []).extend(text_boxes)
+        else:
+            self.strokes.extend(strokes)
+            self.shapes.extend(shapes)
+            self.text_boxes.extend(text_boxes)
+    
     def clear(self):
         """Clear all strokes, shapes, and text boxes (or current page for A4 notes)."""
         if self.note_type == NoteType.A4_NOTES:
@@ -434,6 +547,15 @@ class DrawingDocument:
         else:
             return self.text_boxes
     
+    def get_current_items(self) -> Tuple[List[Stroke], List[Shape], List[TextBox]]:
+        """Get the (strokes, shapes, text boxes) lists for current view at once."""
+        if self.note_type == NoteType.A4_NOTES:
+            page = self.current_page
+            return (self.pages.get(page, []), self.page_shapes.get(page, []),
+                    self.page_text_boxes.get(page, []))
+        else:
+            return self.strokes, self.shapes, self.text_boxes
+    
     def next_page(self):
         """Go to next page (A4 notes only)."""
         if self.note_type == NoteType.A4_NOTES:
@@ -448,6 +570,19 @@ class DrawingDocument:
         if self.note_type == NoteType.A4_NOTES and self.current_page > 1:
             self.current_page -= 1
     
+    def get_page_numbers(self) -> List[int]:
+        """Get the page numbers in ascending order (A4 notes only).
+        
+        Pages are only ever added, so the sorted list is cached and rebuilt
+        when the page count changes or the pages dictionary is replaced.
+        The returned list must not be modified.
+        """
+        cached = self._page_numbers
+        if cached is None or cached[0] is not self.pages or len(cached[1]) != len(self.pages):
+            cached = (self.pages, sorted(self.pages))
+            self._page_numbers = cached
+        return cached[1]
+    
     def get_total_pages(self) -> int:
         """Get total number of pages."""
         if self.note_type == NoteType.A4_NOTES:
@@ -0,0 +1,75 @@
+"""Startup timeline tracing in Chrome trace event format."""
+import importlib._bootstrap
+import json
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class StartupTrace:
+    """Records startup milestones and module import spans.
+    
+    The saved file loads in chrome://tracing or https://ui.perfetto.dev.
+    """
+    
+    def __init__(self):
+        self.events = []
+        self._pid = os.getpid()
+        self._original_find_and_load = None
+    
+    def mark(self, name: str):
+        """Record an instant milestone."""
+        self.events.append({
+            'name': name,
+            'ph': 'i',
+            's': 'p',
+            'ts': time.perf_counter_ns() // 1000,
+            'pid': self._pid,
+            'tid': threading.get_ident()
+        })
+    
+    def start_import_tracing(self):
+        """Record a span for every module imported from now on."""
+        if self._original_find_and_load is not None:
+            return
+        
+        original = importlib._bootstrap._find_and_load
+        events = self.events
+        pid = self._pid
+        
+        def find_and_load(name, import_):
+            start = time.perf_counter_ns()
+            try:
+                return original(name, import_)
+            finally:
+                events.append({
+                    'name': name,
+                    'cat': 'import',
+                    'ph': 'X',
+                    'ts': start // 1000,
+                    'dur': (time.perf_counter_ns() - start) // 1000,
+                    'pid': pid,
+                    'tid': threading.get_ident()
+                })
+        
+        self._original_find_and_load = original
+        importlib._bootstrap._find_and_load = find_and_load
+    
+    def stop_import_tracing(self):
+        """Restore the import machinery patched by start_import_tracing()."""
+        if self._original_find_and_load is not None:
+            importlib._bootstrap._find_and_load = self._original_find_and_load
+            self._original_find_and_load = None
+    
+    def save(self, filepath: str):
+        """Write the collected events as a Chrome trace JSON file."""
+        self.stop_import_tracing()
+        try:
+            with open(filepath, 'w') as f:
+                json.dump({'traceEvents': self.events, 'displayTimeUnit': 'ms'}, f)
+            logger.info("Startup trace written to %s", filepath)
+        except OSError as e:
+            logger.error("Error writing startup trace: %s", e)
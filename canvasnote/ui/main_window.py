@@ -1130,9 +1130,9 @@ class MainWindow(Adw.ApplicationWindow):
         
         sidebar_box.append(footer)
         
-        # Load subjects and update stats
-        self.refresh_subjects_list()
-        self.update_sidebar_stats()
+        # Load subjects and update stats once the window is up - the sidebar
+        # starts hidden, so building a row per subject/note can wait
+        GLib.idle_add(self.refresh_subjects_list)
         
         return sidebar_box
     
@@ -2455,6 +2455,9 @@ Stylus Devices ({len(info['stylus_devices'])}):
         if self.current_file and self.current_subject and self.current_note:
             self.save_current_note()
         
+        # Write pending library index changes
+        self.notes_library.flush()
+        
         # Stop input monitoring
         self.input_handler.stop_monitoring()
         
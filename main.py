@@ -9,6 +9,8 @@ from datetime import datetime
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from canvasnote.app import main, setup_logging
+
 # Set up logging - skip file logging if running as snap
 is_snap = os.getenv('SNAP') is not None
 handlers = []
@@ -24,13 +26,7 @@ if not is_snap:
 # Always log to stdout
 handlers.append(logging.StreamHandler(sys.stdout))
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
-    handlers=handlers
-)
-
-from canvasnote.app import main
+setup_logging(handlers, level=logging.DEBUG)
 
 if __name__ == '__main__':
     sys.exit(main())